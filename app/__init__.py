@@ -1,9 +1,33 @@
 """EdgePowerMeter application package."""
 
+from importlib import import_module
+
 from .version import __version__, __version_info__, APP_NAME
-from .core import Measurement, MeasurementRecord, Statistics, AppSettings
-from .serial import SerialReader, SerialConfig
-from .export import ReportGenerator, CSVImporter
+
+# Re-exported names and their subpackage, imported on first access so that
+# importing one submodule (e.g. app.export.pdf_report in the PDF worker
+# process) does not also load the serial stack and the GUI's dependencies
+_EXPORTS = {
+    "Measurement": ".core",
+    "MeasurementRecord": ".core",
+    "Statistics": ".core",
+    "AppSettings": ".core",
+    "SerialReader": ".serial",
+    "SerialConfig": ".serial",
+    "ReportGenerator": ".export",
+    "CSVImporter": ".export",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "main",
@@ -1,6 +1,11 @@
 """Core data structures and models for EdgePowerMeter."""
 
-from .measurement import Measurement, MeasurementRecord
+from .measurement import (
+    Measurement,
+    MeasurementRecord,
+    MeasurementBuffer,
+    MeasurementTable,
+)
 from .statistics import Statistics
 from .settings import AppSettings
 from .harmonic_analysis import (
@@ -17,6 +22,8 @@ from .cpu_monitor import CPUUsageMonitor
 __all__ = [
     'Measurement',
     'MeasurementRecord', 
+    'MeasurementBuffer',
+    'MeasurementTable',
     'Statistics',
     'AppSettings',
     'HarmonicAnalysis',
@@ -0,0 +1,135 @@
+"""Numeric kernels for statistics, compiled with Numba when available."""
+
+from __future__ import annotations
+import sys
+from typing import Tuple
+
+import numpy as np
+
+# Numba is optional: without it the NumPy implementations are used
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Numba's on-disk cache needs the kernels' source file, which frozen
+# builds do not ship
+_CACHE = not getattr(sys, 'frozen', False)
+
+
+def _trap_integrate_numpy(t: np.ndarray, p: np.ndarray,
+                          i: np.ndarray) -> Tuple[float, float]:
+    dt = np.diff(t)
+    avg_power = np.maximum(0.0, (p[1:] + p[:-1]) * 0.5)
+    avg_current = np.maximum(0.0, (i[1:] + i[:-1]) * 0.5)
+    return float(np.dot(avg_power, dt)), float(np.dot(avg_current, dt))
+
+
+def _summarize_numpy(a: np.ndarray) -> Tuple[float, float, float, float]:
+    # Sums of the samples shifted by a[0]: no cancellation when the
+    # spread is small compared to the level (e.g. a steady 5 V rail)
+    n = a.shape[0]
+    d = np.subtract(a, a[0], dtype=np.float64)
+    s = float(d.sum())
+    s2 = float(np.dot(d, d))
+    var = max(0.0, (s2 - s * s / n) / (n - 1))
+    return float(a.min()), float(a.max()), float(a[0]) + s / n, var ** 0.5
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=_CACHE)
+    def _summarize_numba(a):
+        # Welford's update: mean and M2 (sum of squared deviations) stay
+        # accurate even when the level drifts far from the first sample
+        n = a.shape[0]
+        lo = a[0]
+        hi = a[0]
+        mean = 0.0
+        m2 = 0.0
+        for j in range(n):
+            x = a[j]
+            if x < lo:
+                lo = x
+            if x > hi:
+                hi = x
+            d = x - mean
+            mean += d / (j + 1)
+            m2 += d * (x - mean)
+        return lo, hi, mean, (m2 / (n - 1)) ** 0.5
+
+    # No fastmath: reassociating the sums would cancel the compensation
+    @njit(cache=_CACHE)
+    def _trap_integrate_numba(t, p, i):
+        # Kahan-compensated sums: the rounding error of each step is carried
+        # into the next one, so hours of samples add up without drift
+        energy = 0.0
+        energy_c = 0.0
+        charge = 0.0
+        charge_c = 0.0
+        for k in range(1, t.shape[0]):
+            dt = t[k] - t[k - 1]
+            y = max(0.0, (p[k] + p[k - 1]) * 0.5) * dt - energy_c
+            s = energy + y
+            energy_c = (s - energy) - y
+            energy = s
+            y = max(0.0, (i[k] + i[k - 1]) * 0.5) * dt - charge_c
+            s = charge + y
+            charge_c = (s - charge) - y
+            charge = s
+        return energy, charge
+
+
+def trap_integrate(t: np.ndarray, p: np.ndarray, i: np.ndarray) -> Tuple[float, float]:
+    """Trapezoidal integral of power and current over time.
+
+    Negative interval averages (sensor offset at zero load) count as 0.
+    One fused Kahan-compensated pass under Numba; under NumPy, np.dot's
+    blocked summation keeps the error growth low.
+
+    Args:
+        t: Sample times in seconds
+        p: Power samples [W]
+        i: Current samples [A]
+
+    Returns:
+        (energy in W·s, charge in A·s)
+    """
+    if NUMBA_AVAILABLE:
+        # float32 samples are read as-is; the accumulators are float64
+        energy, charge = _trap_integrate_numba(
+            np.ascontiguousarray(t, dtype=np.float64),
+            np.ascontiguousarray(p),
+            np.ascontiguousarray(i),
+        )
+        return float(energy), float(charge)
+    return _trap_integrate_numpy(t, p, i)
+
+
+def summarize(a: np.ndarray) -> Tuple[float, float, float, float]:
+    """Min, max, mean and sample standard deviation (ddof=1) of a.
+
+    Needs at least 2 samples. One fused Welford pass under Numba; under NumPy
+    the sums come from a single shifted copy instead of std()'s
+    mean/deviation/square temporaries.
+    """
+    if NUMBA_AVAILABLE:
+        lo, hi, mean, std = _summarize_numba(np.ascontiguousarray(a))
+        return float(lo), float(hi), float(mean), float(std)
+    return _summarize_numpy(a)
+
+
+def warmup() -> None:
+    """Compile the Numba kernels ahead of their first use.
+    
+    The kernels otherwise compile lazily on the first call, which stalls
+    that report or export by a few seconds. Call this after the UI is up,
+    preferably off the GUI thread; covers the float64 columns and the
+    float32 sample columns of MeasurementBuffer. No-op without Numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    for dtype in (np.float64, np.float32):
+        samples = np.zeros(2, dtype=dtype)
+        _summarize_numba(samples)
+        _trap_integrate_numba(np.zeros(2), samples, samples)
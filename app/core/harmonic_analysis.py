@@ -13,6 +13,8 @@ from typing import List, Optional, TYPE_CHECKING
 import numpy as np
 from numpy.fft import rfft, rfftfreq
 
+from .measurement import MeasurementTable
+
 if TYPE_CHECKING:
     from .measurement import MeasurementRecord
 
@@ -93,17 +95,18 @@ class HarmonicAnalyzer:
             return None
         
         # Extract signal data
+        table = MeasurementTable.from_records(records)
         if signal_type == 'voltage':
-            signal = np.array([r.voltage for r in records])
+            signal = table.voltage
         elif signal_type == 'current':
-            signal = np.array([r.current for r in records])
+            signal = table.current
         elif signal_type == 'power':
-            signal = np.array([r.power for r in records])
+            signal = table.power
         else:
             return None
         
         # Calculate sampling rate
-        times = np.array([r.relative_time for r in records])
+        times = table.relative_time
         dt = np.mean(np.diff(times))
         if dt <= 0:
             return None
@@ -182,17 +185,18 @@ class HarmonicAnalyzer:
             return None
         
         # Extract signal data
+        table = MeasurementTable.from_records(records)
         if signal_type == 'voltage':
-            signal = np.array([r.voltage for r in records])
+            signal = table.voltage
         elif signal_type == 'current':
-            signal = np.array([r.current for r in records])
+            signal = table.current
         elif signal_type == 'power':
-            signal = np.array([r.power for r in records])
+            signal = table.power
         else:
             return None
         
         # Calculate sampling rate
-        times = np.array([r.relative_time for r in records])
+        times = table.relative_time
         dt = np.mean(np.diff(times))
         if dt <= 0:
             return None
@@ -264,9 +268,10 @@ class HarmonicAnalyzer:
             return None
         
         # Extract signals
-        voltage = np.array([r.voltage for r in voltage_records])
-        current = np.array([r.current for r in current_records])
-        power = np.array([r.power for r in voltage_records])
+        voltage_table = MeasurementTable.from_records(voltage_records)
+        voltage = voltage_table.voltage
+        current = MeasurementTable.from_records(current_records).current
+        power = voltage_table.power
         
         # Calculate apparent power (S = Vrms * Irms)
         v_rms = np.sqrt(np.mean(voltage ** 2))
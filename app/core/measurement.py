@@ -1,8 +1,12 @@
 """Measurement data structures."""
 
 from __future__ import annotations
+import tempfile
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 @dataclass
@@ -32,12 +36,274 @@ class Measurement:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class MeasurementRecord:
     """Measurement record with timing information for storage and export."""
-    timestamp: datetime
+    # No per-instance __dict__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('unix_time', 'relative_time', 'voltage', 'current', 'power')
+    
     unix_time: float
     relative_time: float  # Time from acquisition start (seconds)
     voltage: float
     current: float
     power: float
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Local wall-clock time of the sample (built on demand)."""
+        return datetime.fromtimestamp(self.unix_time)
+    
+    def __reduce__(self):
+        # Default slot-state pickling would assign to the frozen fields
+        return (type(self), tuple(getattr(self, name) for name in self.__slots__))
+
+
+@dataclass(eq=False)
+class MeasurementTable:
+    """Struct-of-arrays run of samples (float columns, usually views).
+    
+    Behaves like a read-only List[MeasurementRecord] for existing callers:
+    len(), iteration and integer indexing materialize records on demand,
+    and slicing returns a sub-table sharing the same memory. Bulk
+    consumers should read the column arrays directly.
+    """
+    relative_time: np.ndarray
+    unix_time: np.ndarray
+    voltage: np.ndarray
+    current: np.ndarray
+    power: np.ndarray
+    
+    @classmethod
+    def from_records(cls, records: Sequence[MeasurementRecord]) -> 'MeasurementTable':
+        """Build a table from records (returned as-is if already a table)."""
+        if isinstance(records, MeasurementTable):
+            return records
+        n = len(records)
+        
+        def column(attr: str) -> np.ndarray:
+            return np.fromiter(
+                (getattr(r, attr) for r in records), dtype=np.float64, count=n
+            )
+        
+        return cls(
+            column('relative_time'), column('unix_time'),
+            column('voltage'), column('current'), column('power'),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.relative_time)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MeasurementTable(
+                self.relative_time[index], self.unix_time[index],
+                self.voltage[index], self.current[index], self.power[index],
+            )
+        return MeasurementRecord(
+            float(self.unix_time[index]), float(self.relative_time[index]),
+            float(self.voltage[index]), float(self.current[index]),
+            float(self.power[index]),
+        )
+    
+    def __iter__(self) -> Iterator[MeasurementRecord]:
+        return iter(self.to_records())
+    
+    def to_records(self) -> List[MeasurementRecord]:
+        """Materialize the samples as MeasurementRecord objects."""
+        return [
+            MeasurementRecord(ts, rel, v, i, p)
+            for ts, rel, v, i, p in zip(
+                self.unix_time.tolist(), self.relative_time.tolist(),
+                self.voltage.tolist(), self.current.tolist(), self.power.tolist(),
+            )
+        ]
+
+
+class MeasurementBuffer:
+    """Growable struct-of-arrays storage for a measurement session.
+    
+    Samples are kept in parallel columns that double in capacity when
+    full, so appending is amortized O(1) and every column is exposed as a
+    contiguous NumPy view. Relative time must be non-decreasing, which
+    allows time-range lookups by binary search.
+    
+    Times are float64 (epoch seconds need the mantissa); voltage, current
+    and power are VALUE_DTYPE (float32), whose 24-bit mantissa is well
+    above the resolution of INA219/INA226-class sensors and halves the
+    memory every scan of those columns reads.
+    
+    A running prefix sum of power is maintained alongside the columns so
+    the mean power of any index range is O(1) (see power_sum).
+    
+    Once capacity reaches SPILL_CAPACITY the columns move to a memory-mapped
+    anonymous temp file, so long captures are paged by the OS instead of
+    being pinned in RAM.
+    """
+    
+    INITIAL_CAPACITY = 4096
+    SPILL_CAPACITY = 1 << 20  # Samples; at or above this, columns are file-backed
+    VALUE_DTYPE = np.float32  # Voltage, current and power columns
+    
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self._n = 0
+        self._allocate(max(1, capacity))
+    
+    def _allocate(self, capacity: int) -> None:
+        """Allocate empty columns with the given capacity."""
+        # Times and the power prefix sum stay float64; samples are VALUE_DTYPE
+        self._unix, self._rel, self._p_cum = self._block(np.float64, capacity)
+        self._v, self._i, self._p = self._block(self.VALUE_DTYPE, capacity)
+    
+    def _block(self, dtype, capacity: int) -> np.ndarray:
+        """Allocate three columns of dtype, file-backed from SPILL_CAPACITY."""
+        if capacity >= self.SPILL_CAPACITY:
+            # The temp file is already unlinked; it is freed with the mapping
+            return np.memmap(
+                tempfile.TemporaryFile(), dtype=dtype, mode='w+', shape=(3, capacity)
+            )
+        return np.empty((3, capacity), dtype=dtype)
+    
+    def _reserve(self, needed: int) -> None:
+        """Grow columns (doubling) so at least `needed` samples fit."""
+        capacity = len(self._rel)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        n = self._n
+        old = (self._unix, self._rel, self._v, self._i, self._p, self._p_cum)
+        self._allocate(capacity)
+        new = (self._unix, self._rel, self._v, self._i, self._p, self._p_cum)
+        for dst, src in zip(new, old):
+            dst[:n] = src[:n]
+    
+    def append(self, unix_time: float, relative_time: float,
+               voltage: float, current: float, power: float) -> None:
+        """Append a single sample. Amortized O(1)."""
+        n = self._n
+        if n == len(self._rel):
+            self._reserve(n + 1)
+        self._unix[n] = unix_time
+        self._rel[n] = relative_time
+        self._v[n] = voltage
+        self._i[n] = current
+        self._p[n] = power
+        # Sum the stored (rounded) value so power_sum matches the column
+        self._p_cum[n] = (self._p_cum[n - 1] if n else 0.0) + float(self._p[n])
+        self._n = n + 1
+    
+    def extend(self, unix_time: np.ndarray, relative_time: np.ndarray,
+               voltage: np.ndarray, current: np.ndarray, power: np.ndarray) -> None:
+        """Append equal-length column arrays."""
+        k = len(relative_time)
+        if k == 0:
+            return
+        n = self._n
+        self._reserve(n + k)
+        self._unix[n:n + k] = unix_time
+        self._rel[n:n + k] = relative_time
+        self._v[n:n + k] = voltage
+        self._i[n:n + k] = current
+        self._p[n:n + k] = power
+        self._accumulate_power(n, k)
+        self._n = n + k
+    
+    def extend_table(self, table: MeasurementTable) -> None:
+        """Append all samples of a MeasurementTable."""
+        self.extend(
+            table.unix_time, table.relative_time,
+            table.voltage, table.current, table.power,
+        )
+    
+    def extend_records(self, records: Sequence[MeasurementRecord]) -> None:
+        """Append a sequence of records column by column."""
+        k = len(records)
+        if k == 0:
+            return
+        n = self._n
+        self._reserve(n + k)
+        for dst, attr in (
+            (self._unix, 'unix_time'),
+            (self._rel, 'relative_time'),
+            (self._v, 'voltage'),
+            (self._i, 'current'),
+            (self._p, 'power'),
+        ):
+            dst[n:n + k] = np.fromiter(
+                (getattr(r, attr) for r in records), dtype=dst.dtype, count=k
+            )
+        self._accumulate_power(n, k)
+        self._n = n + k
+    
+    def _accumulate_power(self, n: int, k: int) -> None:
+        """Extend the power prefix sum over newly written samples [n, n+k)."""
+        cum = self._p_cum[n:n + k]
+        np.cumsum(self._p[n:n + k], dtype=np.float64, out=cum)
+        if n:
+            cum += self._p_cum[n - 1]
+    
+    def clear(self) -> None:
+        """Drop all samples (in-memory capacity is kept, spill files released)."""
+        self._n = 0
+        if len(self._rel) >= self.SPILL_CAPACITY:
+            self._allocate(self.INITIAL_CAPACITY)
+    
+    def __len__(self) -> int:
+        return self._n
+    
+    # Column views (valid until the next append that triggers a resize)
+    @property
+    def unix_time(self) -> np.ndarray:
+        return self._unix[:self._n]
+    
+    @property
+    def relative_time(self) -> np.ndarray:
+        return self._rel[:self._n]
+    
+    @property
+    def voltage(self) -> np.ndarray:
+        return self._v[:self._n]
+    
+    @property
+    def current(self) -> np.ndarray:
+        return self._i[:self._n]
+    
+    @property
+    def power(self) -> np.ndarray:
+        return self._p[:self._n]
+    
+    def search(self, t0: float, t1: float) -> Tuple[int, int]:
+        """Find the index range of samples with t0 <= relative_time <= t1.
+        
+        Returns:
+            (i0, i1) half-open index range, found by binary search.
+        """
+        rel = self._rel[:self._n]
+        i0 = int(np.searchsorted(rel, t0, side='left'))
+        i1 = int(np.searchsorted(rel, t1, side='right'))
+        return i0, max(i0, i1)
+    
+    def power_sum(self, i0: int = 0, i1: Optional[int] = None) -> float:
+        """Sum of power over samples [i0, i1) from the prefix sum. O(1)."""
+        if i1 is None:
+            i1 = self._n
+        if i1 <= i0:
+            return 0.0
+        total = float(self._p_cum[i1 - 1])
+        return total - float(self._p_cum[i0 - 1]) if i0 else total
+    
+    def view(self, i0: int = 0, i1: Optional[int] = None) -> MeasurementTable:
+        """Get zero-copy column views for samples [i0, i1)."""
+        if i1 is None:
+            i1 = self._n
+        return MeasurementTable(
+            self._rel[i0:i1],
+            self._unix[i0:i1],
+            self._v[i0:i1],
+            self._i[i0:i1],
+            self._p[i0:i1],
+        )
+    
+    def to_records(self, i0: int = 0, i1: Optional[int] = None) -> List[MeasurementRecord]:
+        """Materialize samples [i0, i1) as MeasurementRecord objects (for export)."""
+        return self.view(i0, i1).to_records()
@@ -11,6 +11,8 @@ from dataclasses import dataclass
 from typing import List, Optional, TYPE_CHECKING
 import numpy as np
 
+from .measurement import MeasurementTable
+
 if TYPE_CHECKING:
     from .measurement import MeasurementRecord
 
@@ -64,7 +66,8 @@ class PowerSupplyAnalyzer:
             return None
         
         # Extract voltage data
-        voltages = np.array([r.voltage for r in records])
+        records = MeasurementTable.from_records(records)
+        voltages = records.voltage
         
         # Calculate basic statistics
         v_min = np.min(voltages)
@@ -104,7 +107,7 @@ class PowerSupplyAnalyzer:
         load_regulation = None
         settling_time = None
         
-        currents = np.array([r.current for r in records])
+        currents = records.current
         if len(currents) > 10:
             load_regulation, settling_time = self._analyze_load_regulation(
                 records, voltages, currents, nominal_voltage
@@ -126,7 +129,7 @@ class PowerSupplyAnalyzer:
             meets_005percent_spec=meets_005percent
         )
     
-    def _analyze_load_regulation(self, records: List['MeasurementRecord'],
+    def _analyze_load_regulation(self, records: MeasurementTable,
                                 voltages: np.ndarray, currents: np.ndarray,
                                 nominal_voltage: float) -> tuple[Optional[float], Optional[float]]:
         """Analyze load regulation by detecting load steps.
@@ -173,7 +176,7 @@ class PowerSupplyAnalyzer:
         load_regulation_percent = (voltage_change / nominal_voltage) * 100.0
         
         # Calculate settling time
-        times = np.array([r.relative_time for r in records])
+        times = records.relative_time
         settling_time_ms = (times[settling_idx] - times[step_idx]) * 1000.0
         
         return load_regulation_percent, settling_time_ms
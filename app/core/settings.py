@@ -5,6 +5,29 @@ from dataclasses import dataclass, fields
 from PySide6.QtCore import QSettings
 
 
+# Factor from the base SI unit to each selectable display unit
+_UNIT_SCALES = {
+    "V": 1.0, "mV": 1e3,
+    "A": 1.0, "mA": 1e3, "µA": 1e6,
+    "W": 1.0, "mW": 1e3, "µW": 1e6,
+}
+
+
+def _with_slots(cls):
+    """Rebuild a dataclass with its fields as __slots__.
+    
+    Stand-in for dataclass(slots=True), which needs Python 3.10. The field
+    defaults live in the generated __init__, so the class attributes that
+    would clash with the slot descriptors can be dropped.
+    """
+    names = tuple(f.name for f in fields(cls))
+    body = {k: v for k, v in cls.__dict__.items()
+            if k not in names and k not in ('__dict__', '__weakref__')}
+    body['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, body)
+
+
+@_with_slots
 @dataclass
 class AppSettings:
     """Application settings."""
@@ -48,6 +71,24 @@ class AppSettings:
     harmonic_max_order: int = 10  # Maximum harmonic order to analyze (1-20)
     harmonic_signal: str = "current"  # Signal to analyze: "current", "voltage", or "power"
     
+    # Display scale factors, derived from the unit strings rather than stored
+    # so they cannot go stale or be persisted. Per-sample code should read
+    # these once and multiply, instead of branching on the unit text.
+    @property
+    def voltage_scale(self) -> float:
+        """Multiplier from volts to voltage_unit."""
+        return _UNIT_SCALES.get(self.voltage_unit, 1.0)
+    
+    @property
+    def current_scale(self) -> float:
+        """Multiplier from amperes to current_unit."""
+        return _UNIT_SCALES.get(self.current_unit, 1.0)
+    
+    @property
+    def power_scale(self) -> float:
+        """Multiplier from watts to power_unit."""
+        return _UNIT_SCALES.get(self.power_unit, 1.0)
+    
     def save(self) -> None:
         """Save settings to persistent storage.
         
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, TYPE_CHECKING
-import statistics as stats_module
+from typing import Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from .fastmath import summarize, trap_integrate
+from .measurement import MeasurementTable
 
 if TYPE_CHECKING:
-    from .measurement import MeasurementRecord
+    from .measurement import MeasurementBuffer, MeasurementRecord
 
 
-@dataclass
+@dataclass(frozen=True)
 class Statistics:
     """Statistical summary of measurements."""
+    # No per-instance __dict__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = (
+        'count', 'duration_seconds',
+        'voltage_min', 'voltage_max', 'voltage_avg', 'voltage_std',
+        'current_min', 'current_max', 'current_avg', 'current_std',
+        'power_min', 'power_max', 'power_avg', 'power_std',
+        'energy_wh', 'charge_ah',
+    )
+    
     count: int
     duration_seconds: float
     voltage_min: float
@@ -29,48 +42,142 @@ class Statistics:
     energy_wh: float
     charge_ah: float
     
+    # Below this many records from_records() stays in plain Python: building
+    # arrays and the NumPy call overhead cost more than the loops
+    SMALL_RECORDS = 128
+    
+    def __reduce__(self):
+        # Default slot-state pickling would assign to the frozen fields
+        return (type(self), tuple(getattr(self, name) for name in self.__slots__))
+    
     @classmethod
-    def from_records(cls, records: List['MeasurementRecord']) -> 'Statistics | None':
-        """Calculate statistics from measurement records."""
+    def from_records(cls, records: 'Sequence[MeasurementRecord] | MeasurementTable'
+                     ) -> 'Statistics | None':
+        """Calculate statistics from measurement records or a MeasurementTable."""
         if len(records) < 2:
             return None
+        if len(records) < cls.SMALL_RECORDS and not isinstance(records, MeasurementTable):
+            return cls._from_records_small(records)
+        
+        table = MeasurementTable.from_records(records)
+        return cls.from_arrays(
+            table.relative_time, table.voltage, table.current, table.power
+        )
+    
+    @classmethod
+    def _from_records_small(cls, records: 'Sequence[MeasurementRecord]') -> 'Statistics':
+        """Pure-Python from_records() for a short list (2 <= n < SMALL_RECORDS).
+        
+        Same formulas as summarize() and trap_integrate() under NumPy.
+        """
+        count = len(records)
+        t = [r.relative_time for r in records]
+        v = [r.voltage for r in records]
+        i = [r.current for r in records]
+        p = [r.power for r in records]
+        
+        duration = t[-1] - t[0]
+        if duration <= 0:
+            duration = count * 0.01  # Assume ~100Hz sampling
+        
+        energy_ws = charge_as = 0.0
+        for t0, t1, p0, p1, i0, i1 in zip(t, t[1:], p, p[1:], i, i[1:]):
+            # Negative interval averages (sensor offset) count as 0
+            dt = t1 - t0
+            avg = (p0 + p1) * 0.5
+            if avg > 0:
+                energy_ws += avg * dt
+            avg = (i0 + i1) * 0.5
+            if avg > 0:
+                charge_as += avg * dt
+        
+        def summary(a):
+            # Sums shifted by a[0], as in fastmath.summarize()
+            a0 = a[0]
+            s = s2 = 0.0
+            for x in a:
+                d = x - a0
+                s += d
+                s2 += d * d
+            var = max(0.0, (s2 - s * s / count) / (count - 1))
+            return min(a), max(a), a0 + s / count, var ** 0.5
         
-        voltages = [r.voltage for r in records]
-        currents = [r.current for r in records]
-        powers = [r.power for r in records]
+        v_min, v_max, v_avg, v_std = summary(v)
+        i_min, i_max, i_avg, i_std = summary(i)
+        p_min, p_max, p_avg, p_std = summary(p)
+        
+        return cls(
+            count=count,
+            duration_seconds=duration,
+            voltage_min=v_min,
+            voltage_max=v_max,
+            voltage_avg=v_avg,
+            voltage_std=v_std,
+            current_min=i_min,
+            current_max=i_max,
+            current_avg=i_avg,
+            current_std=i_std,
+            power_min=p_min,
+            power_max=p_max,
+            power_avg=p_avg,
+            power_std=p_std,
+            energy_wh=energy_ws / 3600,
+            charge_ah=charge_as / 3600,
+        )
+    
+    @classmethod
+    def from_buffer(cls, buffer: 'MeasurementBuffer', i0: int = 0,
+                    i1: Optional[int] = None) -> 'Statistics | None':
+        """Calculate statistics of buffer samples [i0, i1) on its column views."""
+        if i1 is None:
+            i1 = len(buffer)
+        return cls.from_arrays(
+            buffer.relative_time[i0:i1], buffer.voltage[i0:i1],
+            buffer.current[i0:i1], buffer.power[i0:i1],
+        )
+    
+    @classmethod
+    def from_arrays(cls, relative_time: np.ndarray, voltages: np.ndarray,
+                    currents: np.ndarray, powers: np.ndarray) -> 'Statistics | None':
+        """Calculate statistics from parallel sample arrays.
+
+        relative_time is float64; voltages, currents and powers may be
+        float32 (MeasurementBuffer.VALUE_DTYPE) or float64. Sums and
+        integrals are accumulated in float64 either way.
+        """
+        count = len(relative_time)
+        if count < 2:
+            return None
         
         # Use relative_time for accurate duration
-        duration = records[-1].relative_time - records[0].relative_time
+        duration = float(relative_time[-1] - relative_time[0])
         if duration <= 0:
-            duration = len(records) * 0.01  # Assume ~100Hz sampling
+            duration = count * 0.01  # Assume ~100Hz sampling
         
         # Calculate energy and charge using trapezoidal integration
-        # Use absolute values to handle sensor offset (negative readings at zero load)
-        energy_ws = 0.0
-        charge_as = 0.0
-        for i in range(1, len(records)):
-            dt = records[i].relative_time - records[i-1].relative_time
-            # Use max(0, power) to ignore negative power from sensor offset
-            avg_power = max(0, (records[i].power + records[i-1].power) / 2)
-            avg_current = max(0, (records[i].current + records[i-1].current) / 2)
-            energy_ws += avg_power * dt
-            charge_as += avg_current * dt
+        # Use max(0, ...) on each interval to ignore negative readings from
+        # sensor offset at zero load
+        energy_ws, charge_as = trap_integrate(relative_time, powers, currents)
+        
+        v_min, v_max, v_avg, v_std = summarize(voltages)
+        i_min, i_max, i_avg, i_std = summarize(currents)
+        p_min, p_max, p_avg, p_std = summarize(powers)
         
         return cls(
-            count=len(records),
+            count=count,
             duration_seconds=duration,
-            voltage_min=min(voltages),
-            voltage_max=max(voltages),
-            voltage_avg=stats_module.mean(voltages),
-            voltage_std=stats_module.stdev(voltages) if len(voltages) > 1 else 0,
-            current_min=min(currents),
-            current_max=max(currents),
-            current_avg=stats_module.mean(currents),
-            current_std=stats_module.stdev(currents) if len(currents) > 1 else 0,
-            power_min=min(powers),
-            power_max=max(powers),
-            power_avg=stats_module.mean(powers),
-            power_std=stats_module.stdev(powers) if len(powers) > 1 else 0,
+            voltage_min=v_min,
+            voltage_max=v_max,
+            voltage_avg=v_avg,
+            voltage_std=v_std,
+            current_min=i_min,
+            current_max=i_max,
+            current_avg=i_avg,
+            current_std=i_std,
+            power_min=p_min,
+            power_max=p_max,
+            power_avg=p_avg,
+            power_std=p_std,
             energy_wh=energy_ws / 3600,
             charge_ah=charge_as / 3600,
         )
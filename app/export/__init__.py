@@ -1,9 +1,10 @@
 """Export functionality for EdgePowerMeter."""
 
 from .csv_importer import CSVImporter
-from .pdf_report import ReportGenerator
+from .pdf_report import ReportGenerator, render_pdf
 
 __all__ = [
     "CSVImporter",
     "ReportGenerator",
+    "render_pdf",
 ]
@@ -2,11 +2,33 @@
 
 from __future__ import annotations
 from pathlib import Path
-from datetime import datetime
-from typing import List
+from datetime import datetime, timedelta
+from typing import Optional
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 import csv
+import hashlib
+import os
+import re
+import time
 
-from ..core import MeasurementRecord
+import numpy as np
+from PySide6.QtCore import QStandardPaths
+
+from ..core import MeasurementTable
+
+# np.loadtxt only has a C parser from numpy 1.23 on
+_FAST_LOADTXT = np.lib.NumpyVersion(np.__version__) >= '1.23.0'
+
+# Plain decimal number, as written by ReportGenerator.export_csv
+_CLEAN_NUMBER = re.compile(r'\s*[-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?\s*$')
+
+# Exact layout of the year-first TIMESTAMP_FORMATS. numpy's datetime64
+# parser also takes date-only, truncated, 'T'-separated, zone-suffixed and
+# 'NaT' strings, which strptime rejects, so check before handing it a column.
+_ISO_TIMESTAMP = re.compile(
+    r'\s*\d{4}([-/])\d{2}\1\d{2} \d{2}:\d{2}:\d{2}(?:\.\d{1,6})?\s*$'
+)
 
 
 class CSVImporter:
@@ -27,6 +49,23 @@ class CSVImporter:
         '%d/%m/%Y %H:%M:%S',
     ]
     
+    # Year-first formats that datetime.fromisoformat() (C code) can parse
+    _ISO_FORMATS = frozenset(TIMESTAMP_FORMATS[:4])
+    
+    # Bytes read per block by the np.loadtxt fast path
+    IMPORT_BLOCK_SIZE = 16 * 1024 * 1024
+    
+    # Read buffer of the csv.reader path (the default is 8 KiB)
+    READ_BUFFER_SIZE = 1024 * 1024
+    
+    # Parsed columns are cached in the application cache directory. Bump
+    # CACHE_VERSION whenever parsing changes, so older caches are re-parsed.
+    CACHE_VERSION = 2
+    _CACHE_COLUMNS = ('relative_time', 'unix_time', 'voltage', 'current', 'power')
+    
+    # Last format that matched; files use a single format throughout
+    _last_fmt: Optional[str] = None
+    
     @classmethod
     def detect_separator(cls, filepath: Path) -> str:
         """Detect the separator used in a CSV file.
@@ -40,7 +79,7 @@ class CSVImporter:
         Raises:
             ValueError: If no valid separator is detected
         """
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'rb') as f:
             # Read first few lines for detection
             lines = [f.readline() for _ in range(5)]
         
@@ -49,15 +88,24 @@ class CSVImporter:
         if not lines:
             raise ValueError("File is empty")
         
+        # Byte histogram of every line in one bincount: row k counts the
+        # bytes of line k. Separators are ASCII, and UTF-8 never reuses
+        # ASCII byte values inside multi-byte characters.
+        line_ids = np.repeat(np.arange(len(lines)), [len(line) for line in lines])
+        data = np.frombuffer(b''.join(lines), dtype=np.uint8)
+        hist = np.bincount(
+            line_ids * 256 + data, minlength=len(lines) * 256
+        ).reshape(len(lines), 256)
+        
         # Count separators in each line and find most consistent one
         best_separator = None
         best_score = 0
         
         for sep in cls.SEPARATORS:
-            counts = [line.count(sep) for line in lines]
+            counts = hist[:, ord(sep)]
             # Good separator: consistent count >= 3 (need at least 4 columns)
-            if counts and min(counts) >= 3 and max(counts) == min(counts):
-                score = min(counts)
+            if counts.min() >= 3 and counts.max() == counts.min():
+                score = int(counts.min())
                 if score > best_score:
                     best_score = score
                     best_separator = sep
@@ -85,26 +133,58 @@ class CSVImporter:
         """
         ts_str = ts_str.strip()
         
+        fmt = cls._last_fmt
+        if fmt is not None:
+            try:
+                return cls._parse_with_format(ts_str, fmt)
+            except ValueError:
+                pass
+        
+        fmt = cls._detect_timestamp_format(ts_str)
+        if fmt is None:
+            raise ValueError(f"Unrecognized timestamp format: {ts_str}")
+        cls._last_fmt = fmt
+        return cls._parse_with_format(ts_str, fmt)
+    
+    @classmethod
+    def _detect_timestamp_format(cls, ts_str: str) -> Optional[str]:
+        """Return the first TIMESTAMP_FORMATS entry matching ts_str, or None."""
         for fmt in cls.TIMESTAMP_FORMATS:
             try:
-                return datetime.strptime(ts_str, fmt)
+                datetime.strptime(ts_str, fmt)
             except ValueError:
                 continue
-        
-        raise ValueError(f"Unrecognized timestamp format: {ts_str}")
+            return fmt
+        return None
+    
+    @classmethod
+    def _parse_with_format(cls, ts_str: str, fmt: str) -> datetime:
+        """Parse ts_str with a known format, via fromisoformat when possible."""
+        # fromisoformat() also takes date-only and truncated strings
+        if fmt in cls._ISO_FORMATS and _ISO_TIMESTAMP.match(ts_str):
+            try:
+                return datetime.fromisoformat(ts_str.replace('/', '-'))
+            except ValueError:
+                pass  # e.g. 1-2 fractional digits before Python 3.11
+        return datetime.strptime(ts_str, fmt)
     
     @classmethod
-    def import_csv(cls, filepath: Path) -> List[MeasurementRecord]:
+    def import_csv(cls, filepath: Path) -> MeasurementTable:
         """Import measurements from a CSV file.
         
         Auto-detects separator and timestamp format. Expects columns:
         Timestamp, Voltage, Current, Power (header names are flexible).
+        Rows are sorted by timestamp and relative time starts at 0.
+        The parsed columns are cached in the application cache directory
+        and reused while the CSV's size and modification time, the parser
+        version (CACHE_VERSION) and the local UTC offsets are unchanged.
         
         Args:
             filepath: Path to the CSV file
             
         Returns:
-            List of MeasurementRecord objects
+            MeasurementTable of float64 columns (indexable like a list
+            of MeasurementRecord)
             
         Raises:
             ValueError: If file format is invalid
@@ -113,10 +193,88 @@ class CSVImporter:
         if not filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
         
+        stat = filepath.stat()
+        table = cls._load_cache(filepath, stat)
+        if table is None:
+            table = cls._parse_file(filepath)
+            cls._save_cache(filepath, stat, table)
+        return table
+    
+    @classmethod
+    def _cache_path(cls, filepath: Path) -> Optional[Path]:
+        """Cache file for filepath, or None if there is no cache directory."""
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        if not cache_dir:
+            return None
+        key = hashlib.sha1(str(filepath.resolve()).encode('utf-8')).hexdigest()
+        return Path(cache_dir) / 'csv-import' / f'{key}.npz'
+    
+    @staticmethod
+    def _utc_offsets(hours: np.ndarray) -> np.ndarray:
+        """Local UTC offset in seconds at the start of each Unix-time hour.
+        
+        Timestamps in the CSV are local times, so the parsed unix_time
+        depends on the time zone rules in force when the file was parsed.
+        """
+        return np.array(
+            [time.localtime(h * 3600).tm_gmtoff for h in hours.tolist()],
+            dtype=np.int64,
+        )
+    
+    @classmethod
+    def _load_cache(cls, filepath: Path, stat: os.stat_result) -> Optional[MeasurementTable]:
+        """Return the cached table for filepath, or None if missing or stale."""
+        cache_path = cls._cache_path(filepath)
+        if cache_path is None:
+            return None
+        try:
+            with np.load(cache_path) as cache:
+                if (int(cache['version']) != cls.CACHE_VERSION
+                        or int(cache['size']) != stat.st_size
+                        or int(cache['mtime_ns']) != stat.st_mtime_ns
+                        or not np.array_equal(cls._utc_offsets(cache['hours']),
+                                              cache['utc_offsets'])):
+                    return None
+                return MeasurementTable(
+                    **{name: cache[name] for name in cls._CACHE_COLUMNS}
+                )
+        except Exception:
+            # No cache yet, or unreadable: parse the CSV
+            return None
+    
+    @classmethod
+    def _save_cache(cls, filepath: Path, stat: os.stat_result,
+                    table: MeasurementTable) -> None:
+        """Store table keyed on the CSV's size, mtime and the UTC offsets used."""
+        cache_path = cls._cache_path(filepath)
+        if cache_path is None:
+            return
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        hours = np.unique(np.floor_divide(table.unix_time, 3600)).astype(np.int64)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f, version=cls.CACHE_VERSION,
+                    size=stat.st_size, mtime_ns=stat.st_mtime_ns,
+                    hours=hours, utc_offsets=cls._utc_offsets(hours),
+                    **{name: getattr(table, name) for name in cls._CACHE_COLUMNS},
+                )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Unwritable cache directory etc.: silently skip caching
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    @classmethod
+    def _parse_file(cls, filepath: Path) -> MeasurementTable:
+        """Parse the CSV file itself (no cache)."""
         separator = cls.detect_separator(filepath)
-        records: List[MeasurementRecord] = []
         
-        with open(filepath, 'r', encoding='utf-8') as f:
+        with open(filepath, 'r', encoding='utf-8', newline='',
+                  buffering=cls.READ_BUFFER_SIZE) as f:
             reader = csv.reader(f, delimiter=separator)
             
             # Read header
@@ -130,62 +288,239 @@ class CSVImporter:
             # Detect if file has RelativeTime column (5 columns)
             has_relative_time_col = len(header) >= 5 and 'relative' in header[1].lower()
             
-            # Parse data rows
-            line_num = 1
-            start_time: float = 0.0
+            first_row = next(reader, None)
             
-            for row in reader:
-                line_num += 1
-                
-                if len(row) < 4:
-                    continue  # Skip incomplete rows
-                
+            # Well-formed files (e.g. our own exports) are parsed in C
+            if _FAST_LOADTXT and first_row and cls._is_clean_row(first_row, has_relative_time_col):
                 try:
-                    # Clean values (remove units if present)
-                    ts_str = row[0].strip()
-                    
-                    # Handle both old format (4 cols) and new format (5 cols with RelativeTime)
-                    if has_relative_time_col and len(row) >= 5:
-                        # New format: Timestamp, RelativeTime, Voltage, Current, Power
-                        voltage = float(row[2].strip().replace(',', '.'))
-                        current = float(row[3].strip().replace(',', '.'))
-                        power = float(row[4].strip().replace(',', '.'))
-                    else:
-                        # Old format: Timestamp, Voltage, Current, Power
-                        voltage = float(row[1].strip().replace(',', '.'))
-                        current = float(row[2].strip().replace(',', '.'))
-                        power = float(row[3].strip().replace(',', '.'))
-                    
-                    timestamp = cls.parse_timestamp(ts_str)
-                    unix_time = timestamp.timestamp()
-                    
-                    # Track start time for relative time calculation
-                    if start_time == 0.0:
-                        start_time = unix_time
-                    
-                    records.append(MeasurementRecord(
-                        timestamp=timestamp,
-                        unix_time=unix_time,
-                        relative_time=unix_time - start_time,
-                        voltage=voltage,
-                        current=current,
-                        power=power
-                    ))
-                except (ValueError, IndexError):
-                    # Skip invalid rows but continue processing
-                    continue
-        
-        if not records:
+                    return cls._to_table(
+                        *cls._load_clean(filepath, separator, has_relative_time_col)
+                    )
+                except ValueError:
+                    pass  # Malformed row further down: use the csv reader
+            
+            # Skip incomplete rows
+            rows = [row for row in reader if len(row) >= 4]
+            if first_row and len(first_row) >= 4:
+                rows.insert(0, first_row)
+        
+        try:
+            columns = cls._parse_columns(rows, has_relative_time_col)
+        except (ValueError, IndexError):
+            # Some row is malformed: redo it row by row, skipping bad rows
+            columns = cls._parse_rows(rows, has_relative_time_col)
+        
+        return cls._to_table(*columns)
+    
+    @staticmethod
+    def _to_table(unix: np.ndarray, voltage: np.ndarray, current: np.ndarray,
+                  power: np.ndarray) -> MeasurementTable:
+        """Build the sorted MeasurementTable from parsed columns."""
+        if len(unix) == 0:
             raise ValueError("No valid data rows found in CSV file")
         
-        # Sort by timestamp to ensure correct order
-        records.sort(key=lambda r: r.unix_time)
+        # Sort by timestamp to ensure correct order (stable, like list.sort)
+        order = np.argsort(unix, kind='stable')
+        unix = unix[order]
         
-        # Recalculate relative times after sorting
-        if records:
-            start_time = records[0].unix_time
-            for r in records:
-                # Use object.__setattr__ since dataclass might be frozen
-                object.__setattr__(r, 'relative_time', r.unix_time - start_time)
+        return MeasurementTable(
+            relative_time=unix - unix[0],
+            unix_time=unix,
+            voltage=voltage[order],
+            current=current[order],
+            power=power[order],
+        )
+    
+    @classmethod
+    def _is_clean_row(cls, row, has_relative_time_col: bool) -> bool:
+        """True if row has an ISO timestamp and plain decimal numbers only."""
+        if len(row) != (5 if has_relative_time_col else 4):
+            return False
+        if cls._detect_timestamp_format(row[0].strip()) not in cls._ISO_FORMATS:
+            return False
+        return all(_CLEAN_NUMBER.match(field) for field in row[1:])
+    
+    @classmethod
+    def _load_clean(cls, filepath: Path, separator: str, has_relative_time_col: bool):
+        """Parse a well-formed file with np.loadtxt, one block at a time.
+        
+        A helper thread reads the next IMPORT_BLOCK_SIZE bytes while the
+        current block is parsed, so disk I/O overlaps with parsing.
+        
+        Raises ValueError if any row does not parse; the caller then falls
+        back to the csv reader.
+        """
+        first = 2 if has_relative_time_col else 1
+        blocks = []
+        
+        with open(filepath, 'rb') as f, ThreadPoolExecutor(max_workers=1) as reader:
+            f.readline()  # Header
+            pending = reader.submit(f.read, cls.IMPORT_BLOCK_SIZE)
+            tail = b''
+            while True:
+                data = pending.result()
+                if not data:
+                    break
+                pending = reader.submit(f.read, cls.IMPORT_BLOCK_SIZE)
+                # Parse whole lines only; carry the partial last line over
+                data = tail + data
+                cut = data.rfind(b'\n') + 1
+                tail = data[cut:]
+                if cut:
+                    blocks.append(cls._load_clean_block(data[:cut], separator, first))
+            if tail.strip():
+                blocks.append(cls._load_clean_block(tail, separator, first))
+        
+        if not blocks:
+            raise ValueError("No data rows")
+        return tuple(np.concatenate(column) for column in zip(*blocks))
+    
+    @classmethod
+    def _load_clean_block(cls, data: bytes, separator: str, first: int):
+        """Parse a block of complete lines into (unix, voltage, current, power)."""
+        # loadtxt skips blank lines but warns about each one
+        lines = [line for line in data.decode('utf-8').splitlines() if line.strip()]
+        if not lines:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty, empty, empty
+        options = dict(delimiter=separator, comments=None, ndmin=1)
+        values = np.loadtxt(
+            lines, usecols=(first, first + 1, first + 2), dtype=np.float64,
+            unpack=True, **options,
+        )
+        timestamps = np.loadtxt(lines, usecols=0, dtype=str, **options).tolist()
+        # Only the first row of the file was checked before taking this path
+        cls._check_iso_layout(timestamps)
+        return (cls._parse_iso_timestamps(timestamps), *values)
+    
+    @staticmethod
+    def _to_floats(column) -> np.ndarray:
+        """Convert a column of numeric strings (decimal point or comma)."""
+        # numpy parses str -> float64 in C and tolerates surrounding spaces.
+        # Decimal-point files convert as-is; a decimal comma makes the first
+        # value fail, so only those files pay for the replace().
+        try:
+            return np.array(column, dtype=np.float64)
+        except ValueError:
+            return np.array([s.replace(',', '.') for s in column], dtype=np.float64)
+    
+    @classmethod
+    def _parse_columns(cls, rows, has_relative_time_col: bool):
+        """Parse all rows column by column.
+        
+        Raises ValueError/IndexError on the first malformed row; the
+        caller then falls back to _parse_rows().
+        """
+        if not rows:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty, empty, empty
+        
+        # Old format: Timestamp, Voltage, Current, Power
+        # New format: Timestamp, RelativeTime, Voltage, Current, Power
+        first = 2 if has_relative_time_col else 1
+        if min(map(len, rows)) < first + 3:
+            raise IndexError("short row")
+        
+        columns = list(zip(*rows))
+        return (
+            cls._parse_timestamps(columns[0]),
+            cls._to_floats(columns[first]),
+            cls._to_floats(columns[first + 1]),
+            cls._to_floats(columns[first + 2]),
+        )
+    
+    @classmethod
+    def _parse_timestamps(cls, column) -> np.ndarray:
+        """Convert a column of timestamp strings to Unix seconds.
+        
+        Year-first columns are parsed by numpy in a single call; other
+        formats go through parse_timestamp() one string at a time.
+        """
+        if cls._detect_timestamp_format(column[0].strip()) in cls._ISO_FORMATS:
+            try:
+                cls._check_iso_layout(column)
+                return cls._parse_iso_timestamps(column)
+            except ValueError:
+                pass  # Mixed formats: parse each string on its own
+        
+        parse = cls.parse_timestamp
+        return np.fromiter(
+            (parse(s).timestamp() for s in column),
+            dtype=np.float64, count=len(column),
+        )
+    
+    @staticmethod
+    def _check_iso_layout(column) -> None:
+        """Raise ValueError unless every string has a year-first layout."""
+        match = _ISO_TIMESTAMP.match
+        for s in column:
+            if not match(s):
+                raise ValueError(f"Unrecognized timestamp format: {s.strip()}")
+    
+    @staticmethod
+    def _parse_iso_timestamps(column) -> np.ndarray:
+        """Parse ISO-like local timestamps with numpy's datetime64 parser.
+        
+        Callers check the column with _check_iso_layout() first.
+        """
+        naive = np.array(
+            [s.strip().replace('/', '-') for s in column], dtype='datetime64[us]'
+        ).astype(np.int64) * 1e-6
+        
+        # datetime64 has no time zone, but datetime.timestamp() treats naive
+        # times as local. Offset changes fall on whole minutes, but not
+        # always on whole hours (e.g. Australia/Lord_Howe's half-hour DST),
+        # so look the offset up once per distinct minute.
+        minutes, inverse = np.unique(np.floor_divide(naive, 60), return_inverse=True)
+        epoch = datetime(1970, 1, 1)
+        offsets = np.array([
+            (epoch + timedelta(minutes=m)).timestamp() - m * 60
+            for m in minutes.tolist()
+        ])
+        return naive + offsets[inverse.ravel()]
+    
+    @classmethod
+    def _parse_rows(cls, rows, has_relative_time_col: bool):
+        """Parse rows one at a time, skipping the invalid ones."""
+        # Packed float64 buffers: 8 bytes per value instead of a float object
+        unix_times = array('d')
+        voltages = array('d')
+        currents = array('d')
+        powers = array('d')
+        
+        # Hot loop: bind lookups once. float() ignores surrounding
+        # whitespace and parse_timestamp() strips, so no strip() here.
+        parse = cls.parse_timestamp
+        add_unix, add_v = unix_times.append, voltages.append
+        add_i, add_p = currents.append, powers.append
+        
+        for row in rows:
+            try:
+                # Handle both old format (4 cols) and new format (5 cols with RelativeTime)
+                if has_relative_time_col and len(row) >= 5:
+                    # New format: Timestamp, RelativeTime, Voltage, Current, Power
+                    voltage = float(row[2].replace(',', '.'))
+                    current = float(row[3].replace(',', '.'))
+                    power = float(row[4].replace(',', '.'))
+                else:
+                    # Old format: Timestamp, Voltage, Current, Power
+                    voltage = float(row[1].replace(',', '.'))
+                    current = float(row[2].replace(',', '.'))
+                    power = float(row[3].replace(',', '.'))
+                
+                unix_time = parse(row[0]).timestamp()
+            except (ValueError, IndexError):
+                # Skip invalid rows but continue processing
+                continue
+            
+            add_unix(unix_time)
+            add_v(voltage)
+            add_i(current)
+            add_p(power)
         
-        return records
+        return (
+            np.frombuffer(unix_times, dtype=np.float64),
+            np.frombuffer(voltages, dtype=np.float64),
+            np.frombuffer(currents, dtype=np.float64),
+            np.frombuffer(powers, dtype=np.float64),
+        )
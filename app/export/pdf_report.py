@@ -3,18 +3,292 @@
 from __future__ import annotations
 from pathlib import Path
 from datetime import datetime
-from typing import List
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
 from io import BytesIO
-import csv
+import os
+import queue
+import threading
+from types import SimpleNamespace
 import numpy as np
 
 from ..version import __version__, APP_NAME
-from ..core import Statistics, MeasurementRecord, HarmonicAnalyzer, PowerSupplyAnalyzer
+from ..core import (
+    Statistics, MeasurementRecord, MeasurementTable, HarmonicAnalyzer, PowerSupplyAnalyzer
+)
+
+# Accepted wherever a run of samples is expected
+Records = Union[Sequence[MeasurementRecord], MeasurementTable]
+
+def _format_timestamps(unix: np.ndarray) -> List[str]:
+    """Format Unix times as local 'YYYY-MM-DD HH:MM:SS.mmm' strings.
+    
+    Same output as datetime.fromtimestamp(t).strftime(...)[:-3] per value,
+    but formatted by numpy's datetime64 in one call.
+    """
+    # Round to microseconds exactly like datetime.fromtimestamp()
+    frac, whole = np.modf(unix)
+    us = whole.astype(np.int64) * 1_000_000 + np.round(frac * 1e6).astype(np.int64)
+    
+    # UTC -> local: offsets only change on quarter-hour boundaries, so look
+    # them up once per distinct 15-minute bucket
+    buckets, inverse = np.unique(us // 900_000_000, return_inverse=True)
+    epoch = datetime(1970, 1, 1)
+    offsets_us = np.array([
+        int((datetime.fromtimestamp(b * 900) - epoch).total_seconds() - b * 900) * 1_000_000
+        for b in buckets.tolist()
+    ], dtype=np.int64)
+    local = (us + offsets_us[inverse.ravel()]).astype('datetime64[us]')
+    
+    # 'YYYY-MM-DDTHH:MM:SS.mmm' (truncated to ms, like [:-3]). Swap the 'T'
+    # for a space in the UCS-4 buffer itself rather than re-slicing every
+    # Python string.
+    text = np.datetime_as_string(local, unit='ms')
+    if len(text):
+        text.view(np.uint32).reshape(len(text), -1)[:, 10] = ord(' ')
+    return text.tolist()
+
+
+# Rows of the summary, energy and derived tables of the PDF report. Header
+# rows are literal; cells are filled with str.format_map() from the
+# Statistics fields plus the derived values computed in export_pdf.
+SUMMARY_TEMPLATE = (
+    ("Metric", "Min", "Max", "Average", "Std Dev"),
+    ("Voltage (V)", "{voltage_min:.4f}", "{voltage_max:.4f}", "{voltage_avg:.4f}", "{voltage_std:.4f}"),
+    ("Current (A)", "{current_min:.4f}", "{current_max:.4f}", "{current_avg:.4f}", "{current_std:.4f}"),
+    ("Power (W)", "{power_min:.4f}", "{power_max:.4f}", "{power_avg:.4f}", "{power_std:.4f}"),
+)
+
+ENERGY_TEMPLATE = (
+    ("Metric", "Value", "Unit"),
+    ("Total Energy", "{energy_wh:.6f}", "Wh"),
+    ("Total Energy", "{energy_mwh:.4f}", "mWh"),
+    ("Total Charge", "{charge_ah:.6f}", "Ah"),
+    ("Total Charge", "{charge_mah:.4f}", "mAh"),
+    ("Average Power", "{power_avg:.4f}", "W"),
+    ("Peak Power", "{power_max:.4f}", "W"),
+)
+
+DERIVED_TEMPLATE = (
+    ("Metric", "Value", "Description"),
+    ("Sampling Rate", "{sampling_rate:.1f} Hz", "Samples per second"),
+    ("Voltage Ripple", "{voltage_ripple:.4f} V", "Peak-to-peak"),
+    ("Current Ripple", "{current_ripple:.4f} A", "Peak-to-peak"),
+    ("Power Factor Est.", "{power_factor:.3f}", "P / (V × I)"),
+    ("Impedance Est.", "{impedance:.2f} Ω", "V / I average"),
+)
+
+
+# reportlab names used by the report, imported on first use (see _reportlab)
+_RL = None
+
+
+def _reportlab() -> SimpleNamespace:
+    """Import the reportlab names used here once per process.
+    
+    reportlab is only needed for PDF export, so importing it is deferred
+    to the first report instead of happening with this module.
+    """
+    global _RL
+    if _RL is None:
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import mm
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.platypus import (
+            BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Table, TableStyle, 
+            CondPageBreak, Image, PageBreak
+        )
+        _RL = SimpleNamespace(
+            colors=colors, A4=A4, mm=mm, TA_CENTER=TA_CENTER,
+            getSampleStyleSheet=getSampleStyleSheet, ParagraphStyle=ParagraphStyle,
+            BaseDocTemplate=BaseDocTemplate, PageTemplate=PageTemplate, Frame=Frame,
+            Paragraph=Paragraph, Spacer=Spacer,
+            Table=Table, TableStyle=TableStyle, CondPageBreak=CondPageBreak,
+            Image=Image, PageBreak=PageBreak,
+        )
+    return _RL
+
+
+# Paragraph and table styles of the report, built on first use (see _report_styles)
+_STYLES = None
+
+
+def _report_styles() -> SimpleNamespace:
+    """Build the report's ParagraphStyle and TableStyle objects once.
+    
+    They only describe fonts, colors and grid lines, never the data, so
+    every export_pdf call of the process shares the same instances.
+    """
+    global _STYLES
+    if _STYLES is None:
+        rl = _reportlab()
+        colors, ParagraphStyle, TableStyle = rl.colors, rl.ParagraphStyle, rl.TableStyle
+        styles = rl.getSampleStyleSheet()
+        
+        muted = colors.HexColor('#8b949e')
+        accent = colors.HexColor('#58a6ff')
+        
+        def table_style(background, align, font_size=10, padding=8):
+            # Tables with a colored header row and striped body rows
+            return TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), background),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 0), (-1, -1), font_size),
+                *align,
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#30363d')),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f6f8fa')]),
+                ('TOPPADDING', (0, 0), (-1, -1), padding),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+            ])
+        
+        label_value = [
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ]
+        
+        _STYLES = SimpleNamespace(
+            title=ParagraphStyle(
+                name='ReportTitle',
+                parent=styles['Heading1'],
+                fontSize=24,
+                spaceAfter=20,
+                textColor=colors.HexColor('#1a1a2e'),
+                alignment=rl.TA_CENTER,
+            ),
+            section=ParagraphStyle(
+                name='SectionTitle',
+                parent=styles['Heading2'],
+                fontSize=14,
+                spaceBefore=20,
+                spaceAfter=10,
+                textColor=accent,
+            ),
+            subsection=ParagraphStyle(
+                name='SubsectionTitle', parent=styles['Heading3'],
+                fontSize=12, textColor=accent,
+            ),
+            info=ParagraphStyle(
+                name='Info',
+                parent=styles['Normal'],
+                fontSize=10,
+                textColor=muted,
+            ),
+            warning=ParagraphStyle(
+                name='Warning', parent=styles['Normal'],
+                fontSize=11, textColor=colors.HexColor('#f85149'),
+                fontName='Helvetica-Bold',
+            ),
+            warning_details=ParagraphStyle(
+                name='WarningDetails', parent=styles['Normal'],
+                fontSize=9, textColor=muted,
+                leftIndent=20, bulletIndent=10,
+            ),
+            recommendation=ParagraphStyle(
+                name='Recommendation', parent=styles['Normal'],
+                fontSize=10, leftIndent=10, bulletIndent=5,
+            ),
+            footer=ParagraphStyle(
+                name='Footer',
+                parent=styles['Normal'],
+                fontSize=8,
+                textColor=muted,
+                alignment=rl.TA_CENTER,
+            ),
+            meta_table=TableStyle([
+                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('TEXTCOLOR', (0, 0), (0, -1), muted),
+                *label_value,
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ]),
+            summary_table=table_style(accent, [('ALIGN', (0, 0), (-1, -1), 'CENTER')]),
+            energy_table=table_style(
+                colors.HexColor('#3fb950'), [('ALIGN', (1, 0), (-1, -1), 'CENTER')]),
+            derived_table=table_style(
+                colors.HexColor('#a371f7'), [('ALIGN', (1, 0), (1, -1), 'CENTER')],
+                font_size=9, padding=6),
+            thd_table=table_style(accent, label_value),
+            psu_table=table_style(accent, label_value + [('ALIGN', (2, 0), (2, -1), 'CENTER')]),
+            compliance_table=table_style(accent, [('ALIGN', (0, 0), (-1, -1), 'LEFT')]),
+        )
+    return _STYLES
+
+
+# Page layout of every report page, built on first use (see _page_template)
+_PAGE_TEMPLATE = None
+
+# A4 margins of the report, in mm
+PAGE_MARGIN_MM = 20
+
+
+def _page_template():
+    """Return the PageTemplate of the report, built once per process.
+    
+    Same single-frame layout SimpleDocTemplate sets up on every build.
+    Documents only read their templates, and each frame is reset at the
+    top of every page, so all reports of the process can share it.
+    """
+    global _PAGE_TEMPLATE
+    if _PAGE_TEMPLATE is None:
+        rl = _reportlab()
+        margin = PAGE_MARGIN_MM * rl.mm
+        page_width, page_height = rl.A4
+        _PAGE_TEMPLATE = rl.PageTemplate(id='main', frames=[rl.Frame(
+            margin, margin, page_width - 2 * margin, page_height - 2 * margin,
+            id='normal',
+        )])
+    return _PAGE_TEMPLATE
+
+
+# Figure shared by all report graphs of this process (see _reset_figure)
+_FIGURE = None
+
+
+def _reset_figure(width: float, height: float, dpi: float = 100):
+    """Return the shared matplotlib Figure, cleared and resized.
+    
+    Creating a Figure with its Agg canvas is a fixed cost of every graph,
+    so the report graphs draw on one figure in turn. pyplot is not used,
+    which also keeps its global figure registry out of the way.
+    """
+    global _FIGURE
+    if _FIGURE is None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        _FIGURE = Figure()
+        FigureCanvasAgg(_FIGURE)
+    else:
+        _FIGURE.clf()
+        # tight_layout() of the previous graph moved the subplot margins
+        from matplotlib import rcParams
+        _FIGURE.subplots_adjust(**{
+            name: rcParams[f'figure.subplot.{name}']
+            for name in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')
+        })
+    _FIGURE.set_size_inches(width, height)
+    _FIGURE.set_dpi(dpi)
+    return _FIGURE
 
 
 class ReportGenerator:
     """Generate PDF and CSV reports from measurement data."""
     
+    # Rows formatted per write() call in export_csv
+    CSV_CHUNK_ROWS = 10000
+    
+    # File buffer of export_csv (the default is 8 KiB)
+    CSV_WRITE_BUFFER_SIZE = 1024 * 1024
+    
+    # Formatted chunks export_csv may queue ahead of its writer thread
+    CSV_WRITE_QUEUE_CHUNKS = 16
+    
+    # Raster resolution of the measurement graphs
+    GRAPH_DPI = 110
+    
     def __init__(self):
         self.include_fft = False  # Set by caller based on settings
         self.include_harmonic_analysis = False
@@ -23,77 +297,127 @@ class ReportGenerator:
         self.harmonic_signal = "current"
         self.nominal_voltage = None  # Auto-detect if None
     
-    def export_csv(self, filepath: Path, records: List[MeasurementRecord], 
-                   separator: str = ',') -> None:
+    def options(self) -> dict:
+        """Return the report flags above as plain data (see render_pdf)."""
+        return dict(vars(self))
+    
+    def export_csv(self, filepath: Path,
+                   records: Union[Records, Iterable[MeasurementRecord]],
+                   separator: str = ',', durable: bool = False) -> None:
         """Export measurements to CSV file.
         
         Includes both absolute timestamp and relative time (seconds from start).
+        records may also be any iterable of MeasurementRecord (e.g. a
+        generator); it is consumed CSV_CHUNK_ROWS at a time.
+        
+        With durable=True the file is fsync'ed once after the last row, so a
+        crash or power loss right after the export cannot lose its tail.
+        
+        Values come from MeasurementBuffer's float32 columns (about 7
+        significant digits) and are written with 6 decimals, so readings of
+        10 or more can differ from the source in the last printed digit,
+        e.g. after an import/re-export round trip.
         """
-        with open(filepath, 'w', newline='') as f:
-            writer = csv.writer(f, delimiter=separator)
-            writer.writerow(['Timestamp', 'RelativeTime[s]', 'Voltage[V]', 'Current[A]', 'Power[W]'])
-            for r in records:
-                writer.writerow([
-                    r.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3],
-                    f"{r.relative_time:.6f}",
-                    f"{r.voltage:.6f}",
-                    f"{r.current:.6f}",
-                    f"{r.power:.6f}",
-                ])
+        header = ['Timestamp', 'RelativeTime[s]', 'Voltage[V]', 'Current[A]', 'Power[W]']
+        # Same line terminator as csv.writer; no field ever needs quoting
+        # since the numbers and timestamps never contain ',', ';' or tab
+        eol = '\r\n'
+        
+        # Binary mode: every field is ASCII, so each chunk is encoded once
+        # and skips the TextIOWrapper layer. No flush() until close: the
+        # buffer decides when to hit the disk.
+        with open(filepath, 'wb', buffering=self.CSV_WRITE_BUFFER_SIZE) as f:
+            f.write((separator.join(header) + eol).encode('ascii'))
+            
+            # A writer thread drains the formatted chunks, so the disk writes
+            # (which release the GIL) overlap with formatting the next chunk
+            chunks = queue.Queue(maxsize=self.CSV_WRITE_QUEUE_CHUNKS)
+            errors = []
+            
+            def write_chunks() -> None:
+                text = chunks.get()
+                while text is not None:
+                    if not errors:
+                        try:
+                            f.write(text)
+                        except BaseException as e:
+                            # Keep draining so the producer never blocks
+                            errors.append(e)
+                    text = chunks.get()
+            
+            writer = threading.Thread(target=write_chunks, name='csv-writer', daemon=True)
+            writer.start()
+            try:
+                # Format CSV_CHUNK_ROWS rows at a time and hand each chunk to
+                # a single write() instead of one writerow() per sample
+                for chunk in self._iter_chunks(records, self.CSV_CHUNK_ROWS):
+                    if errors:
+                        break
+                    lines = [
+                        separator.join((ts, f"{t:.6f}", f"{v:.6f}", f"{i:.6f}", f"{p:.6f}"))
+                        for ts, t, v, i, p in zip(
+                            _format_timestamps(chunk.unix_time), chunk.relative_time.tolist(),
+                            chunk.voltage.tolist(), chunk.current.tolist(),
+                            chunk.power.tolist(),
+                        )
+                    ]
+                    lines.append('')
+                    chunks.put(eol.join(lines).encode('ascii'))
+            finally:
+                chunks.put(None)
+                writer.join()
+            if errors:
+                raise errors[0]
+            if durable:
+                # One flush and fsync for the whole file, never per chunk
+                f.flush()
+                os.fsync(f.fileno())
+    
+    @staticmethod
+    def _iter_chunks(records: Union[Records, Iterable[MeasurementRecord]],
+                     size: int) -> Iterator[MeasurementTable]:
+        """Yield records as tables of at most size samples."""
+        if isinstance(records, MeasurementTable):
+            for start in range(0, len(records), size):
+                yield records[start:start + size]
+            return
+        it = iter(records)
+        while True:
+            chunk = list(islice(it, size))
+            if not chunk:
+                return
+            yield MeasurementTable.from_records(chunk)
     
     def export_pdf(self, filepath: Path, stats: Statistics, 
-                   records: List[MeasurementRecord]) -> None:
+                   records: Records) -> None:
         """Export report to PDF file with graphs."""
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import A4
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import mm
-        from reportlab.lib.enums import TA_CENTER
-        from reportlab.platypus import (
-            SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, 
-            KeepTogether, Image, PageBreak
-        )
-        
-        doc = SimpleDocTemplate(
-            str(filepath),
-            pagesize=A4,
-            rightMargin=20*mm,
-            leftMargin=20*mm,
-            topMargin=20*mm,
-            bottomMargin=20*mm,
-        )
+        records = MeasurementTable.from_records(records)
         
-        styles = getSampleStyleSheet()
+        rl = _reportlab()
+        Paragraph, Spacer = rl.Paragraph, rl.Spacer
+        Table, CondPageBreak = rl.Table, rl.CondPageBreak
+        PageBreak = rl.PageBreak
         
-        # Custom styles
-        title_style = ParagraphStyle(
-            name='ReportTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=20,
-            textColor=colors.HexColor('#1a1a2e'),
-            alignment=TA_CENTER,
-        )
-        
-        section_style = ParagraphStyle(
-            name='SectionTitle',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceBefore=20,
-            spaceAfter=10,
-            textColor=colors.HexColor('#58a6ff'),
+        margin = PAGE_MARGIN_MM * rl.mm
+        doc = rl.BaseDocTemplate(
+            str(filepath),
+            pagesize=rl.A4,
+            pageTemplates=[_page_template()],
+            rightMargin=margin,
+            leftMargin=margin,
+            topMargin=margin,
+            bottomMargin=margin,
         )
         
-        story = []
-        
-        # Title
-        story.append(Paragraph("EdgePowerMeter Report", title_style))
-        story.append(Spacer(1, 10))
+        # Shared style objects, built by the first report of the process
+        st = _report_styles()
+        section_style = st.section
         
         # Metadata
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        start = records[0].timestamp.strftime("%Y-%m-%d %H:%M:%S") if records else "N/A"
-        end = records[-1].timestamp.strftime("%Y-%m-%d %H:%M:%S") if records else "N/A"
+        unix = records.unix_time
+        start = datetime.fromtimestamp(unix[0]).strftime("%Y-%m-%d %H:%M:%S") if len(unix) else "N/A"
+        end = datetime.fromtimestamp(unix[-1]).strftime("%Y-%m-%d %H:%M:%S") if len(unix) else "N/A"
         
         meta_data = [
             ["Report Generated:", now],
@@ -103,139 +427,75 @@ class ReportGenerator:
             ["Duration:", self._format_duration(stats.duration_seconds)],
         ]
         
-        meta_table = Table(meta_data, colWidths=[100, 200])
-        meta_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#8b949e')),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        story.append(meta_table)
-        story.append(Spacer(1, 20))
-        
-        # Summary Statistics - keep title and table together
-        summary_data = [
-            ["Metric", "Min", "Max", "Average", "Std Dev"],
-            ["Voltage (V)", 
-             f"{stats.voltage_min:.4f}", f"{stats.voltage_max:.4f}", 
-             f"{stats.voltage_avg:.4f}", f"{stats.voltage_std:.4f}"],
-            ["Current (A)", 
-             f"{stats.current_min:.4f}", f"{stats.current_max:.4f}", 
-             f"{stats.current_avg:.4f}", f"{stats.current_std:.4f}"],
-            ["Power (W)", 
-             f"{stats.power_min:.4f}", f"{stats.power_max:.4f}", 
-             f"{stats.power_avg:.4f}", f"{stats.power_std:.4f}"],
-        ]
+        # Every value the summary, energy and derived tables print, by the
+        # field names used in their templates
+        v_min, v_max, v_avg = stats.voltage_min, stats.voltage_max, stats.voltage_avg
+        i_min, i_max, i_avg = stats.current_min, stats.current_max, stats.current_avg
+        apparent_power = v_avg * i_avg
+        values = {name: getattr(stats, name) for name in stats.__slots__}
+        values.update(
+            energy_mwh=stats.energy_wh * 1000,
+            charge_mah=stats.charge_ah * 1000,
+            sampling_rate=stats.count / stats.duration_seconds if stats.duration_seconds > 0 else 0,
+            voltage_ripple=v_max - v_min,
+            current_ripple=i_max - i_min,
+            power_factor=stats.power_avg / apparent_power if apparent_power > 0 else 0,
+            impedance=v_avg / i_avg if i_avg > 0 else 0,
+        )
+        summary_data = [[cell.format_map(values) for cell in row] for row in SUMMARY_TEMPLATE]
+        energy_data = [[cell.format_map(values) for cell in row] for row in ENERGY_TEMPLATE]
+        derived_data = [[cell.format_map(values) for cell in row] for row in DERIVED_TEMPLATE]
         
-        summary_table = Table(summary_data, colWidths=[80, 70, 70, 70, 70])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#58a6ff')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#30363d')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f6f8fa')]),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
-        story.append(KeepTogether([
+        # Each section after the metadata starts on a new page unless its
+        # title and table fit (CondPageBreak).
+        story = [
+            # Title
+            Paragraph("EdgePowerMeter Report", st.title),
+            Spacer(1, 10),
+            
+            # Metadata
+            Table(meta_data, colWidths=[100, 200], style=st.meta_table),
+            Spacer(1, 20),
+            
+            # Summary Statistics
+            CondPageBreak(self._section_height(len(summary_data))),
             Paragraph("Summary Statistics", section_style),
-            summary_table,
+            Table(summary_data, colWidths=[80, 70, 70, 70, 70], style=st.summary_table),
             Spacer(1, 20),
-        ]))
-        
-        # Energy Analysis - keep title and table together
-        energy_data = [
-            ["Metric", "Value", "Unit"],
-            ["Total Energy", f"{stats.energy_wh:.6f}", "Wh"],
-            ["Total Energy", f"{stats.energy_wh * 1000:.4f}", "mWh"],
-            ["Total Charge", f"{stats.charge_ah:.6f}", "Ah"],
-            ["Total Charge", f"{stats.charge_ah * 1000:.4f}", "mAh"],
-            ["Average Power", f"{stats.power_avg:.4f}", "W"],
-            ["Peak Power", f"{stats.power_max:.4f}", "W"],
-        ]
-        
-        energy_table = Table(energy_data, colWidths=[120, 100, 60])
-        energy_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3fb950')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#30363d')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f6f8fa')]),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
-        story.append(KeepTogether([
+            
+            # Energy Analysis
+            CondPageBreak(self._section_height(len(energy_data))),
             Paragraph("Energy Analysis", section_style),
-            energy_table,
+            Table(energy_data, colWidths=[120, 100, 60], style=st.energy_table),
             Spacer(1, 20),
-        ]))
-        
-        # Derived Metrics - keep title and table together
-        sampling_rate = stats.count / stats.duration_seconds if stats.duration_seconds > 0 else 0
-        power_factor = stats.power_avg / (stats.voltage_avg * stats.current_avg) if (stats.voltage_avg * stats.current_avg) > 0 else 0
-        impedance = stats.voltage_avg / stats.current_avg if stats.current_avg > 0 else 0
-        
-        derived_data = [
-            ["Metric", "Value", "Description"],
-            ["Sampling Rate", f"{sampling_rate:.1f} Hz", "Samples per second"],
-            ["Voltage Ripple", f"{stats.voltage_max - stats.voltage_min:.4f} V", "Peak-to-peak"],
-            ["Current Ripple", f"{stats.current_max - stats.current_min:.4f} A", "Peak-to-peak"],
-            ["Power Factor Est.", f"{power_factor:.3f}", "P / (V × I)"],
-            ["Impedance Est.", f"{impedance:.2f} Ω", "V / I average"],
-        ]
-        
-        derived_table = Table(derived_data, colWidths=[100, 80, 180])
-        derived_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#a371f7')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#30363d')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f6f8fa')]),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
-        story.append(KeepTogether([
+            
+            # Derived Metrics
+            CondPageBreak(self._section_height(len(derived_data), font_size=9, padding=6)),
             Paragraph("Derived Metrics", section_style),
-            derived_table,
-        ]))
-        
-        # Generate graphs
-        story.append(PageBreak())
-        story.append(Paragraph("Measurement Graphs", section_style))
-        story.append(Spacer(1, 10))
+            Table(derived_data, colWidths=[100, 80, 180], style=st.derived_table),
+            
+            # Graphs
+            PageBreak(),
+            Paragraph("Measurement Graphs", section_style),
+            Spacer(1, 10),
+        ]
         
         # Create graphs using matplotlib
-        graph_images = self._generate_graphs(records)
-        for img in graph_images:
-            story.append(img)
-            story.append(Spacer(1, 10))
+        for img in self._generate_graphs(records):
+            story += [img, Spacer(1, 10)]
         
         # FFT Analysis (if enabled)
         if self.include_fft:
-            story.append(PageBreak())
-            story.append(Paragraph("Frequency Spectrum Analysis", section_style))
-            story.append(Spacer(1, 5))
-            story.append(Paragraph(
-                "FFT analysis of current signal to identify switching noise, ripple, and periodic patterns.",
-                ParagraphStyle(
-                    name='FFTInfo',
-                    parent=styles['Normal'],
-                    fontSize=10,
-                    textColor=colors.HexColor('#8b949e'),
-                )
-            ))
-            story.append(Spacer(1, 10))
+            story += [
+                PageBreak(),
+                Paragraph("Frequency Spectrum Analysis", section_style),
+                Spacer(1, 5),
+                Paragraph(
+                    "FFT analysis of current signal to identify switching noise, ripple, and periodic patterns.",
+                    st.info,
+                ),
+                Spacer(1, 10),
+            ]
             
             fft_image = self._generate_fft_graph(records)
             if fft_image:
@@ -243,9 +503,11 @@ class ReportGenerator:
         
         # Frequency Spectrum Analysis (if enabled)
         if self.include_harmonic_analysis:
-            story.append(PageBreak())
-            story.append(Paragraph("Frequency Spectrum Analysis", section_style))
-            story.append(Spacer(1, 5))
+            story += [
+                PageBreak(),
+                Paragraph("Frequency Spectrum Analysis", section_style),
+                Spacer(1, 5),
+            ]
             
             # Perform frequency spectrum analysis
             signal_name = self.harmonic_signal.capitalize()
@@ -253,19 +515,6 @@ class ReportGenerator:
             harmonic_result = analyzer.analyze_signal(records, self.harmonic_signal, max_display_freq=25.0)
             
             if harmonic_result:
-                # Add description
-                story.append(Paragraph(
-                    f"Frequency spectrum analysis of {signal_name.lower()} signal. "
-                    f"Shows dominant frequencies in the signal variations and overall modulation characteristics.",
-                    ParagraphStyle(
-                        name='HarmonicInfo',
-                        parent=styles['Normal'],
-                        fontSize=10,
-                        textColor=colors.HexColor('#8b949e'),
-                    )
-                ))
-                story.append(Spacer(1, 10))
-                
                 # Spectrum Summary Table
                 thd_data = [
                     ["Metric", "Value"],
@@ -274,75 +523,56 @@ class ReportGenerator:
                     ["Modulation Depth", f"{harmonic_result.thd_percent:.2f}%"],
                 ]
                 
-                thd_table = Table(thd_data, colWidths=[150, 200])
-                thd_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#58a6ff')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#30363d')),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f6f8fa')]),
-                    ('TOPPADDING', (0, 0), (-1, -1), 8),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ]))
-                story.append(thd_table)
-                story.append(Spacer(1, 15))
+                story += [
+                    # Description
+                    Paragraph(
+                        f"Frequency spectrum analysis of {signal_name.lower()} signal. "
+                        f"Shows dominant frequencies in the signal variations and overall modulation characteristics.",
+                        st.info,
+                    ),
+                    Spacer(1, 10),
+                    Table(thd_data, colWidths=[150, 200], style=st.thd_table),
+                    Spacer(1, 15),
+                ]
                 
                 # Frequency spectrum graph
                 harmonic_graph = self._generate_harmonic_graph(harmonic_result, signal_name, records)
                 if harmonic_graph:
                     story.append(harmonic_graph)
             else:
-                story.append(Paragraph(
-                    f"⚠ Frequency spectrum analysis could not be performed on {signal_name.lower()} signal.",
-                    ParagraphStyle(name='Warning', parent=styles['Normal'], 
-                                  fontSize=11, textColor=colors.HexColor('#f85149'), 
-                                  fontName='Helvetica-Bold')
-                ))
-                story.append(Spacer(1, 8))
-                story.append(Paragraph(
-                    "Possible reasons:<br/>"
-                    "• Signal is too constant - requires measurable variations for spectrum analysis<br/>"
-                    "• Signal amplitude is too low (&lt; 0.1mV/mA/mW)<br/>"
-                    "• Insufficient data points (&lt; 100 samples)<br/>"
-                    "<br/>"
-                    "Suggestions:<br/>"
-                    "• Ensure the system has dynamic load variations<br/>"
-                    "• Increase measurement duration for better frequency resolution<br/>"
-                    "• Try analyzing 'current' signal for switching power supplies",
-                    ParagraphStyle(name='WarningDetails', parent=styles['Normal'], 
-                                  fontSize=9, textColor=colors.HexColor('#8b949e'),
-                                  leftIndent=20, bulletIndent=10)
-                ))
+                story += [
+                    Paragraph(
+                        f"⚠ Frequency spectrum analysis could not be performed on {signal_name.lower()} signal.",
+                        st.warning,
+                    ),
+                    Spacer(1, 8),
+                    Paragraph(
+                        "Possible reasons:<br/>"
+                        "• Signal is too constant - requires measurable variations for spectrum analysis<br/>"
+                        "• Signal amplitude is too low (&lt; 0.1mV/mA/mW)<br/>"
+                        "• Insufficient data points (&lt; 100 samples)<br/>"
+                        "<br/>"
+                        "Suggestions:<br/>"
+                        "• Ensure the system has dynamic load variations<br/>"
+                        "• Increase measurement duration for better frequency resolution<br/>"
+                        "• Try analyzing 'current' signal for switching power supplies",
+                        st.warning_details,
+                    ),
+                ]
         
         # Power Supply Quality Analysis (for DC systems)
         if self.include_psu_analysis:
-            story.append(PageBreak())
-            story.append(Paragraph("Power Supply Quality Analysis", section_style))
-            story.append(Spacer(1, 5))
+            story += [
+                PageBreak(),
+                Paragraph("Power Supply Quality Analysis", section_style),
+                Spacer(1, 5),
+            ]
             
             # Perform PSU quality analysis
             psu_analyzer = PowerSupplyAnalyzer()
             psu_quality = psu_analyzer.analyze_voltage_quality(records, self.nominal_voltage)
             
             if psu_quality:
-                # Add description
-                story.append(Paragraph(
-                    "DC power supply quality metrics including voltage regulation, ripple, "
-                    "and load regulation analysis. These metrics help evaluate if the power "
-                    "supply meets the requirements for your application.",
-                    ParagraphStyle(
-                        name='PSUInfo',
-                        parent=styles['Normal'],
-                        fontSize=10,
-                        textColor=colors.HexColor('#8b949e'),
-                    )
-                ))
-                story.append(Spacer(1, 10))
-                
                 # Quality Summary Table
                 psu_data = [
                     ["Metric", "Value", "Status"],
@@ -358,30 +588,6 @@ class ReportGenerator:
                 if psu_quality.settling_time_ms is not None:
                     psu_data.append(["Settling Time", f"{psu_quality.settling_time_ms:.1f} ms", ""])
                 
-                psu_table = Table(psu_data, colWidths=[150, 150, 80])
-                psu_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#58a6ff')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-                    ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-                    ('ALIGN', (2, 0), (2, -1), 'CENTER'),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#30363d')),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f6f8fa')]),
-                    ('TOPPADDING', (0, 0), (-1, -1), 8),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ]))
-                story.append(psu_table)
-                story.append(Spacer(1, 15))
-                
-                # Compliance Check
-                story.append(Paragraph("Specification Compliance", 
-                                      ParagraphStyle(name='PSUCompliance', parent=styles['Heading3'], 
-                                                    fontSize=12, textColor=colors.HexColor('#58a6ff'))))
-                story.append(Spacer(1, 8))
-                
                 compliance_data = [
                     ["Specification", "Requirement", "Status"],
                     ["Precision PSU", "< 0.05% ripple", "✓ Pass" if psu_quality.meets_005percent_spec else "✗ Fail"],
@@ -389,53 +595,57 @@ class ReportGenerator:
                     ["Switching PSU", "< 1% ripple", "✓ Pass" if psu_quality.meets_1percent_spec else "✗ Fail"],
                 ]
                 
-                compliance_table = Table(compliance_data, colWidths=[150, 120, 110])
-                compliance_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#58a6ff')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#30363d')),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f6f8fa')]),
-                    ('TOPPADDING', (0, 0), (-1, -1), 8),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ]))
-                story.append(compliance_table)
-                story.append(Spacer(1, 15))
+                story += [
+                    # Description
+                    Paragraph(
+                        "DC power supply quality metrics including voltage regulation, ripple, "
+                        "and load regulation analysis. These metrics help evaluate if the power "
+                        "supply meets the requirements for your application.",
+                        st.info,
+                    ),
+                    Spacer(1, 10),
+                    Table(psu_data, colWidths=[150, 150, 80], style=st.psu_table),
+                    Spacer(1, 15),
+                    
+                    # Compliance Check
+                    Paragraph("Specification Compliance", st.subsection),
+                    Spacer(1, 8),
+                    Table(compliance_data, colWidths=[150, 120, 110], style=st.compliance_table),
+                    Spacer(1, 15),
+                ]
                 
                 # Recommendations
                 recommendations = PowerSupplyAnalyzer.get_quality_recommendations(psu_quality)
                 if recommendations:
-                    story.append(Paragraph("Recommendations", 
-                                          ParagraphStyle(name='PSURecommendations', parent=styles['Heading3'], 
-                                                        fontSize=12, textColor=colors.HexColor('#58a6ff'))))
-                    story.append(Spacer(1, 8))
-                    
+                    story += [Paragraph("Recommendations", st.subsection), Spacer(1, 8)]
                     for rec in recommendations:
-                        story.append(Paragraph(
-                            rec,
-                            ParagraphStyle(name='Recommendation', parent=styles['Normal'], 
-                                          fontSize=10, leftIndent=10, bulletIndent=5)
-                        ))
-                        story.append(Spacer(1, 3))
+                        story += [Paragraph(rec, st.recommendation), Spacer(1, 3)]
         
         # Footer
-        story.append(Spacer(1, 30))
-        story.append(Paragraph(
-            f"Generated by {APP_NAME} v{__version__}",
-            ParagraphStyle(
-                name='Footer',
-                parent=styles['Normal'],
-                fontSize=8,
-                textColor=colors.HexColor('#8b949e'),
-                alignment=TA_CENTER,
-            )
-        ))
+        story += [
+            Spacer(1, 30),
+            Paragraph(f"Generated by {APP_NAME} v{__version__}", st.footer),
+        ]
         
         doc.build(story)
     
+    @staticmethod
+    def _section_height(rows: int, font_size: float = 10, padding: float = 8) -> float:
+        """Approximate height in points of a section title plus its table.
+        
+        Used for CondPageBreak, which only compares this against the space
+        left on the page, instead of KeepTogether, which lays the section
+        out to measure it and again on the next page if it does not fit.
+        
+        Args:
+            rows: Table rows, header included
+            font_size: Table font size (leading is 1.2x)
+            padding: Top and bottom cell padding of the table style
+        """
+        # SectionTitle: 14pt font plus spaceBefore 20 and spaceAfter 10
+        title = 14 * 1.2 + 20 + 10
+        return title + rows * (font_size * 1.2 + 2 * padding)
+    
     @staticmethod
     def _format_duration(seconds: float) -> str:
         """Format duration in human-readable format."""
@@ -446,39 +656,37 @@ class ReportGenerator:
         else:
             return f"{seconds / 3600:.2f} hours"
     
-    def _generate_graphs(self, records: List[MeasurementRecord]) -> list:
+    def _generate_graphs(self, records: Records) -> list:
         """Generate graphs for voltage, current, and power.
         
         Args:
-            records: List of measurement records
+            records: Measurement records or MeasurementTable
             
         Returns:
             List of reportlab Image objects
         """
-        import matplotlib
-        matplotlib.use('Agg')  # Non-interactive backend
-        import matplotlib.pyplot as plt
-        from reportlab.platypus import Image
-        from reportlab.lib.units import mm
+        rl = _reportlab()
+        Image, mm = rl.Image, rl.mm
+        
+        table = MeasurementTable.from_records(records)
         
-        # Downsample if too many points (for performance)
+        # Downsample if too many points (for performance): one point per
+        # block of `step` samples, keeping each block's min and max so
+        # short peaks stay visible
         MAX_GRAPH_POINTS = 2000
-        if len(records) > MAX_GRAPH_POINTS:
-            step = len(records) // MAX_GRAPH_POINTS
-            records = records[::step]
+        step = max(1, len(table) // MAX_GRAPH_POINTS)
+        starts = np.arange(0, len(table), step)
         
         # Extract data - use relative_time for X axis (starts from 0)
-        times = [r.relative_time for r in records]
-        voltages = [r.voltage for r in records]
-        currents = [r.current for r in records]
-        powers = [r.power for r in records]
+        times = table.relative_time[starts]
+        voltages = table.voltage
+        currents = table.current
+        powers = table.power
         
         # Graph settings
         fig_width = 170 * mm / 25.4  # Convert mm to inches
         fig_height = 70 * mm / 25.4  # Slightly taller for better readability
         
-        images = []
-        
         # Define graph configurations - darker, more visible colors
         graphs = [
             ('Voltage [V]', voltages, '#1f77b4', '#0d3d6e'),  # Blue
@@ -486,36 +694,52 @@ class ReportGenerator:
             ('Power [W]', powers, '#2ca02c', '#1a5c1a'),      # Green
         ]
         
-        for title, data, line_color, fill_color in graphs:
-            fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-            
+        # One figure with a row per channel: a single matplotlib setup,
+        # layout pass and PNG encode instead of three
+        fig = _reset_figure(fig_width, fig_height * len(graphs), self.GRAPH_DPI)
+        axes = fig.subplots(len(graphs), 1)
+        fig.patch.set_facecolor('white')
+        
+        # Format x-axis based on duration (in seconds from 0)
+        rel = table.relative_time
+        duration = rel[-1] - rel[0] if len(rel) else 0
+        
+        for (title, data, line_color, fill_color), ax in zip(graphs, axes):
             # Set white background
             ax.set_facecolor('white')
-            fig.patch.set_facecolor('white')
+            
+            if step > 1:
+                counts = np.diff(np.append(starts, len(data)))
+                line = np.add.reduceat(data, starts) / counts
+                # Min/max envelope of each block
+                ax.fill_between(
+                    times, np.minimum.reduceat(data, starts),
+                    np.maximum.reduceat(data, starts),
+                    color=line_color, alpha=0.35, linewidth=0,
+                )
+            else:
+                line = data
             
             # Thicker line for better visibility
-            ax.plot(times, data, color=line_color, linewidth=1.5)
-            ax.fill_between(times, data, alpha=0.3, color=fill_color)
+            ax.plot(times, line, color=line_color, linewidth=1.5)
+            ax.fill_between(times, line, alpha=0.3, color=fill_color)
             
             ax.set_ylabel(title, fontsize=11, fontweight='bold')
             ax.set_xlabel('Time [s]', fontsize=10)
             ax.grid(True, alpha=0.4, linestyle='-', linewidth=0.5)
             
-            # Format x-axis based on duration (in seconds from 0)
-            duration = times[-1] - times[0] if times else 0
             if duration > 3600:
                 # Show in minutes for long recordings
                 ax.set_xlabel('Time [min]', fontsize=10)
                 ax.set_xticks([t for t in range(0, int(duration) + 1, int(duration / 10) or 1)])
                 ax.set_xticklabels([f'{t/60:.1f}' for t in ax.get_xticks()])
             
-            plt.xticks(fontsize=9)
-            plt.yticks(fontsize=9)
+            ax.tick_params(labelsize=9)
             
             # Add min/max/avg annotations
-            min_val = min(data)
-            max_val = max(data)
-            avg_val = sum(data) / len(data)
+            min_val = float(data.min())
+            max_val = float(data.max())
+            avg_val = float(data.mean())
             
             # Average line - more visible
             ax.axhline(y=avg_val, color=line_color, linestyle='--', alpha=0.7, linewidth=1.2)
@@ -537,44 +761,37 @@ class ReportGenerator:
             y_range = max_val - min_val
             if y_range > 0:
                 ax.set_ylim(min_val - y_range * 0.1, max_val + y_range * 0.15)
-            
-            plt.tight_layout()
-            
-            # Save to buffer - higher DPI for better quality
-            buf = BytesIO()
-            fig.savefig(buf, format='png', dpi=200, bbox_inches='tight', 
-                       facecolor='white', edgecolor='none')
-            buf.seek(0)
-            plt.close(fig)
-            
-            # Create reportlab Image
-            img = Image(buf, width=170*mm, height=70*mm)
-            images.append(img)
         
-        return images
+        fig.tight_layout()
+        
+        # Save to buffer
+        buf = BytesIO()
+        fig.savefig(buf, format='png', dpi=self.GRAPH_DPI, bbox_inches='tight', 
+                   facecolor='white', edgecolor='none')
+        buf.seek(0)
+        
+        # Create reportlab Image (fits one A4 page below the section title)
+        return [Image(buf, width=170*mm, height=70*mm * len(graphs))]
     
-    def _generate_fft_graph(self, records: List[MeasurementRecord]):
+    def _generate_fft_graph(self, records: Records):
         """Generate FFT spectrum analysis of current signal.
         
         Args:
-            records: List of measurement records
+            records: Measurement records or MeasurementTable
             
         Returns:
             reportlab Image object or None if insufficient data
         """
-        import matplotlib
-        matplotlib.use('Agg')
-        import matplotlib.pyplot as plt
-        import numpy as np
-        from reportlab.platypus import Image
-        from reportlab.lib.units import mm
+        rl = _reportlab()
+        Image, mm = rl.Image, rl.mm
         
         if len(records) < 64:
             return None  # Need enough samples for meaningful FFT
         
         # Extract current data
-        currents = np.array([r.current for r in records])
-        times = np.array([r.relative_time for r in records])
+        table = MeasurementTable.from_records(records)
+        currents = table.current
+        times = table.relative_time
         
         # Calculate sampling rate
         dt = np.mean(np.diff(times))
@@ -605,7 +822,8 @@ class ReportGenerator:
         fig_width = 170 * mm / 25.4
         fig_height = 90 * mm / 25.4
         
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(fig_width, fig_height))
+        fig = _reset_figure(fig_width, fig_height)
+        ax1, ax2 = fig.subplots(2, 1)
         fig.patch.set_facecolor('white')
         
         # Plot 1: Linear frequency spectrum
@@ -673,14 +891,13 @@ class ReportGenerator:
                      edgecolor='#d62728', alpha=0.9)
         )
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save to buffer
         buf = BytesIO()
         fig.savefig(buf, format='png', dpi=200, bbox_inches='tight',
                    facecolor='white', edgecolor='none')
         buf.seek(0)
-        plt.close(fig)
         
         return Image(buf, width=170*mm, height=90*mm)
     
@@ -695,7 +912,7 @@ class ReportGenerator:
         }
         return symbols.get(rating, "")
     
-    def _generate_harmonic_graph(self, harmonic_result, signal_name: str, records: List[MeasurementRecord] = None):
+    def _generate_harmonic_graph(self, harmonic_result, signal_name: str, records: Records = None):
         """Generate comprehensive frequency spectrum analysis graphs.
         
         Args:
@@ -707,30 +924,27 @@ class ReportGenerator:
             reportlab Image object or None
         """
         try:
-            import matplotlib
-            matplotlib.use('Agg')
-            import matplotlib.pyplot as plt
-            import numpy as np
-            from reportlab.platypus import Image
-            from reportlab.lib.units import mm
+            rl = _reportlab()
+            Image, mm = rl.Image, rl.mm
             
             # Create figure with 4 subplots
-            fig = plt.figure(figsize=(10, 10))
+            fig = _reset_figure(10, 10)
             gs = fig.add_gridspec(3, 2, hspace=0.35, wspace=0.3)
             
             # 1. Signal Waveform (top, full width)
             ax_wave = fig.add_subplot(gs[0, :])
             if records and len(records) > 0:
                 # Extract signal
-                times = np.array([r.relative_time for r in records])
+                table = MeasurementTable.from_records(records)
+                times = table.relative_time
                 if signal_name.lower() == 'current':
-                    signal = np.array([r.current for r in records])
+                    signal = table.current
                     unit = 'A'
                 elif signal_name.lower() == 'voltage':
-                    signal = np.array([r.voltage for r in records])
+                    signal = table.voltage
                     unit = 'V'
                 else:
-                    signal = np.array([r.power for r in records])
+                    signal = table.power
                     unit = 'W'
                 
                 # Downsample if too many points
@@ -845,27 +1059,29 @@ class ReportGenerator:
                 ax_fft.set_xticks([])
                 ax_fft.set_yticks([])
             
-            plt.suptitle(f'Frequency Spectrum Analysis - {signal_name}', fontsize=13, fontweight='bold', y=0.995)
+            fig.suptitle(f'Frequency Spectrum Analysis - {signal_name}', fontsize=13, fontweight='bold', y=0.995)
             
             # Save to buffer
             buf = BytesIO()
-            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight',
+            fig.savefig(buf, format='png', dpi=150, bbox_inches='tight',
                        facecolor='white', edgecolor='none')
             buf.seek(0)
-            plt.close(fig)
             
             return Image(buf, width=180*mm, height=180*mm)
-            
-            # Save to buffer
-            buf = BytesIO()
-            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight',
-                       facecolor='white', edgecolor='none')
-            buf.seek(0)
-            plt.close(fig)
-            
-            return Image(buf, width=170*mm, height=130*mm)
         
         except Exception as e:
             print(f"[WARNING] Failed to generate harmonic graph: {e}")
             return None
 
+
+def render_pdf(options: dict, path: Path, stats: Statistics, records: Records) -> None:
+    """Render a PDF report from ReportGenerator.options() in a worker process.
+    
+    Submitted to a spawn process pool by the main window. Only plain data
+    and this module-level function are pickled, so the worker imports this
+    module (reportlab and matplotlib still load on first use) rather than
+    whatever the caller's bound objects drag in.
+    """
+    generator = ReportGenerator()
+    vars(generator).update(options)
+    generator.export_pdf(path, stats, records)
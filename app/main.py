@@ -1,10 +1,19 @@
 import sys
-from PySide6 import QtWidgets, QtGui
-
-from app.ui.main_window import MainWindow
+import multiprocessing
+import threading
 
 
 def main():
+    # PDF export runs in a spawned process; frozen builds must let the
+    # child run its task instead of starting another GUI
+    multiprocessing.freeze_support()
+    
+    # Imported here so that spawned PDF workers, which re-import the main
+    # module, do not load Qt and the whole UI
+    from PySide6 import QtWidgets, QtGui
+    from app.core import fastmath
+    from app.ui.main_window import MainWindow
+    
     # Set application metadata before creating QApplication
     # This ensures proper WM_CLASS on Linux for dock icon matching
     QtWidgets.QApplication.setDesktopFileName("edgepowermeter")
@@ -16,6 +25,11 @@ def main():
     QtGui.QIcon.setThemeName('')
     win = MainWindow()
     win.show()
+    
+    # JIT-compile the statistics kernels in the background once the window
+    # is up, instead of stalling startup or the first report
+    threading.Thread(target=fastmath.warmup, name='jit-warmup', daemon=True).start()
+    
     sys.exit(app.exec())
 
 
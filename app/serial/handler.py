@@ -32,6 +32,7 @@ class SerialPortHandler:
         self._file: Optional[io.TextIOWrapper] = None
         self._ser: Optional[serial.Serial] = None
         self._use_direct = False
+        self._partial = ""  # Line fragment left by a read timeout
 
     @property
     def is_open(self) -> bool:
@@ -125,14 +126,39 @@ class SerialPortHandler:
         self._ser.reset_input_buffer()  # Flush any old data
 
     def readline(self) -> str:
-        """Read a line from serial port."""
+        """Read a line from serial port.
+        
+        A read that times out mid-line is held back and completed by the
+        next call, so short timeouts never split a measurement.
+        """
         if self._use_direct and self._file:
             line = self._file.readline()
-            return line.strip() if line else ""
         elif self._ser:
             raw = self._ser.readline()
-            return raw.decode(errors='ignore').strip() if raw else ""
-        return ""
+            line = raw.decode(errors='ignore') if raw else ""
+        else:
+            return ""
+        if not line.endswith('\n'):
+            self._partial += line
+            return ""
+        line, self._partial = self._partial + line, ""
+        return line.strip()
+
+    def set_timeout(self, seconds: float) -> None:
+        """Set how long a read may block waiting for data.
+        
+        The direct path uses termios VTIME, which counts in tenths of a
+        second; shorter timeouts round up to 0.1 s.
+        """
+        try:
+            if self._use_direct and self._fd is not None:
+                attrs = termios.tcgetattr(self._fd)
+                attrs[6][termios.VTIME] = max(1, min(255, round(seconds * 10)))
+                termios.tcsetattr(self._fd, termios.TCSANOW, attrs)
+            elif self._ser:
+                self._ser.timeout = seconds
+        except Exception:
+            pass  # Port closed under us by stop()
 
     def close(self) -> None:
         """Close all serial connections."""
@@ -148,6 +174,7 @@ class SerialPortHandler:
             except Exception:
                 pass
             self._file = None
+        self._partial = ""
 
     def _close_fd(self) -> None:
         """Close file descriptor."""
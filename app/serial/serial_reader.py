@@ -6,8 +6,10 @@ from the EdgePowerMeter firmware and emits it as Qt signals.
 
 from __future__ import annotations
 
+import time
 import traceback
 
+import numpy as np
 from PySide6 import QtCore
 
 from .config import SerialConfig
@@ -19,12 +21,23 @@ from .sampler import SampleRateController
 class SerialReader(QtCore.QThread):
     """Background thread that reads measurements from serial port.
     
+    Parsed measurements are delivered in batches to keep cross-thread
+    signal traffic (and GIL hand-offs) at one emit per batch rather than
+    one per sample, with no per-sample Python objects in the payload.
+    
     Signals:
-        data_received: Emitted when a valid measurement is parsed.
+        batch_received: Emitted with (samples, first_unix_time). `samples`
+            is an (n, 4) float64 array of (host time, voltage, current,
+            power) where host time is time.perf_counter() when the line
+            was read; `first_unix_time` is the firmware timestamp of the
+            first sample.
         error: Emitted when an error occurs.
     """
     
-    data_received = QtCore.Signal(object)
+    BATCH_SIZE = 128  # Flush after this many samples...
+    BATCH_INTERVAL_S = 0.010  # ...or this long after the first one
+    
+    batch_received = QtCore.Signal(object, float)
     error = QtCore.Signal(str)
 
     def __init__(self, port: str, baud: int = SerialConfig.DEFAULT_BAUD, 
@@ -49,19 +62,37 @@ class SerialReader(QtCore.QThread):
             return
 
         self._running = True
+        batch = np.empty((self.BATCH_SIZE, 4), dtype=np.float64)
+        count = 0
+        first_unix = 0.0
+        deadline = 0.0
         
         while self._running:
             try:
                 line = self._port_handler.readline()
+                now = time.perf_counter()
                 
-                if not line:
-                    continue
-
                 # Check if we should accept this sample (subsampling control)
-                if self._sampler.should_accept_sample():
+                if line and self._sampler.should_accept_sample():
                     measurement = self._parser.parse_line(line)
                     if measurement:
-                        self.data_received.emit(measurement.to_dict())
+                        if count == 0:
+                            deadline = now + self.BATCH_INTERVAL_S
+                            first_unix = measurement.timestamp.timestamp()
+                            # A quiet line must not hold the batch past its
+                            # deadline: block only briefly while one is pending
+                            self._port_handler.set_timeout(self.BATCH_INTERVAL_S)
+                        row = batch[count]
+                        row[0] = now
+                        row[1] = measurement.voltage
+                        row[2] = measurement.current
+                        row[3] = measurement.power
+                        count += 1
+                
+                if count and (count >= self.BATCH_SIZE or now >= deadline):
+                    self.batch_received.emit(batch[:count].copy(), first_unix)
+                    count = 0
+                    self._port_handler.set_timeout(SerialConfig.DEFAULT_TIMEOUT)
                     
             except (TypeError, OSError, IOError) as e:
                 if not self._running:
@@ -74,6 +105,8 @@ class SerialReader(QtCore.QThread):
                 self.error.emit(f"Errore inaspettato:\n{traceback.format_exc()}")
                 break
 
+        if count:
+            self.batch_received.emit(batch[:count].copy(), first_unix)
         self._port_handler.close()
 
     def stop(self, wait_ms: int = 3000) -> None:
@@ -1,25 +1,167 @@
 """Settings dialog for EdgePowerMeter."""
 
 from __future__ import annotations
-from typing import Optional
+from dataclasses import fields, replace
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+import weakref
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QPushButton, QComboBox, QCheckBox,
     QSpinBox, QDoubleSpinBox, QGroupBox, QWidget,
     QTabWidget, QFrame
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QSignalBlocker, QStringListModel, QUrl, Signal
+from PySide6.QtGui import QDesktopServices
 
 from ...core import AppSettings
 from ..theme import ThemeColors
 
 
+# Combo items, built once per process
+_VOLTAGE_UNITS = ("V", "mV")
+_CURRENT_UNITS = ("A", "mA", "µA")
+_POWER_UNITS = ("W", "mW", "µW")
+_BAUD_RATES = (9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600)
+_BAUD_RATE_TEXTS = tuple(str(b) for b in _BAUD_RATES)
+_TIMESTAMP_FORMATS = (
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+    "Unix timestamp",
+)
+
+# CSV separator character -> combo text, in combo order
+_SEP_TO_TEXT = {",": ", (comma)", ";": "; (semicolon)", "\t": "\\t (tab)"}
+_CSV_SEPARATORS = tuple(_SEP_TO_TEXT)
+
+# Harmonic analysis signal setting value and combo text, in combo order
+_HARMONIC_SIGNALS = ("current", "voltage", "power")
+_HARMONIC_SIGNAL_TEXTS = tuple(sig.capitalize() for sig in _HARMONIC_SIGNALS)
+
+
+def _bind(widget: str, field: str, values: Optional[Sequence] = None) -> tuple:
+    """Binding of widget attribute `widget` to AppSettings field `field`.
+    
+    `values` lists the setting value of each item of a combo box, in item
+    order; check and spin boxes take the value itself and leave it None.
+    """
+    index = None if values is None else {v: i for i, v in enumerate(values)}
+    return widget, field, values, index
+
+
+# Widgets of each tab (in _TAB_LABELS order) and the settings they edit.
+# Loading and storing a tab is one loop over its row.
+_TAB_BINDINGS = (
+    (_bind("dark_mode_check", "dark_mode"),),
+    (
+        _bind("voltage_unit_combo", "voltage_unit", _VOLTAGE_UNITS),
+        _bind("current_unit_combo", "current_unit", _CURRENT_UNITS),
+        _bind("power_unit_combo", "power_unit", _POWER_UNITS),
+    ),
+    (
+        _bind("plot_points_spin", "plot_points"),
+        _bind("show_grid_check", "show_grid"),
+        _bind("grid_alpha_spin", "grid_alpha"),
+        _bind("show_crosshair_check", "show_crosshair"),
+        _bind("show_cpu_usage_check", "show_cpu_usage"),
+        _bind("moving_avg_check", "use_moving_average"),
+        _bind("moving_avg_spin", "moving_average_window"),
+    ),
+    (
+        _bind("baud_rate_combo", "baud_rate", _BAUD_RATES),
+        _bind("auto_reconnect_check", "auto_reconnect"),
+        _bind("reconnect_interval_spin", "reconnect_interval"),
+        _bind("target_sample_rate_spin", "target_sample_rate"),
+    ),
+    (
+        _bind("csv_separator_combo", "csv_separator", _CSV_SEPARATORS),
+        _bind("timestamp_format_combo", "timestamp_format", _TIMESTAMP_FORMATS),
+        _bind("include_fft_check", "include_fft"),
+        _bind("include_harmonic_check", "include_harmonic_analysis"),
+        _bind("harmonic_max_order_spin", "harmonic_max_order"),
+        _bind("harmonic_signal_combo", "harmonic_signal", _HARMONIC_SIGNALS),
+    ),
+    (),
+)
+
+# Value accessors of the bound check and spin boxes, by widget type
+_GETTERS = {
+    QCheckBox: QCheckBox.isChecked,
+    QSpinBox: QSpinBox.value,
+    QDoubleSpinBox: QDoubleSpinBox.value,
+}
+_SETTERS = {
+    QCheckBox: QCheckBox.setChecked,
+    QSpinBox: QSpinBox.setValue,
+    QDoubleSpinBox: QDoubleSpinBox.setValue,
+}
+
+# Widget tooltips
+_TIP_DARK_MODE = "Enable dark theme for the application"
+_TIP_PLOT_POINTS = "Maximum points rendered in the visible window"
+_TIP_GRID_ALPHA = "Grid line opacity (0.1 - 1.0)"
+_TIP_CROSSHAIR = "Display V/I/P values when hovering over the graph"
+_TIP_MOVING_AVG = "Use a sliding window average instead of total average"
+_TIP_MOVING_AVG_WINDOW = "Number of samples for moving average"
+_TIP_CPU_USAGE = "Display a live CPU usage bar near the connection status"
+_TIP_AUTO_RECONNECT = "Automatically reconnect if the serial port disconnects"
+_TIP_RECONNECT_INTERVAL = "Seconds between reconnection attempts"
+_TIP_TARGET_SAMPLE_RATE = (
+    "Target sampling rate in Hz.\n"
+    "• 0 = Maximum device rate (no subsampling)\n"
+    "• < Device max = Subsample to this rate\n"
+    "• > Device max = Use maximum device rate"
+)
+_TIP_FFT = (
+    "Add frequency spectrum analysis of current signal to identify\n"
+    "switching noise, ripple, and periodic patterns"
+)
+_TIP_HARMONIC = (
+    "Add Total Harmonic Distortion analysis and individual harmonic components.\n"
+    "Essential for power quality assessment and compliance testing."
+)
+_TIP_HARMONIC_SIGNAL = "Select which signal to analyze for harmonics"
+_TIP_HARMONIC_MAX_ORDER = "Maximum harmonic order to analyze (1=fundamental)"
+
+# Tab titles, in the order of _tab_builders
+_TAB_LABELS = ("🎨 Appearance", "📏 Units", "📊 Display", "🔌 Serial", "📁 Export", "ℹ️ About")
+
+# Moving average info text while the average covers the whole recording
+_AVG_INFO_TOTAL = "Average calculated over all recorded samples."
+
+
+@lru_cache(maxsize=None)
+def _system_info() -> tuple:
+    """(label, value) rows of the About tab's System group.
+    
+    Computed on the first About tab shown and then reused: importing
+    platform and probing the OS is not free, and the answers never change.
+    """
+    import sys
+    import platform
+    
+    rows = [
+        ("Python:", f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"),
+        ("Platform:", platform.system()),
+    ]
+    try:
+        from PySide6 import __version__ as pyside_version
+        rows.append(("PySide6:", pyside_version))
+    except ImportError:
+        pass
+    return tuple(rows)
+
+
 class SettingsDialog(QDialog):
     """Settings dialog with modern styling."""
     
-    settings_changed = Signal(AppSettings)
+    settings_changed = Signal(AppSettings, frozenset)  # settings, changed field names
     theme_changed = Signal(bool)  # True = dark mode
     
+    # Dialog reused by get_or_create() (weakref.ref, or None)
+    _instance = None
+    
     def __init__(
         self,
         settings: AppSettings,
@@ -29,110 +171,39 @@ class SettingsDialog(QDialog):
         super().__init__(parent)
         self.settings = settings
         self.theme = theme
-        self._setup_ui()
-        self._apply_theme()
-        self._load_settings()
+        # Styled by the "#settingsDialog" rules of the main window's
+        # stylesheet, which the dialog inherits from its parent
+        self.setObjectName("settingsDialog")
+        self._setup_ui()  # Loads the settings of each tab as it is built
     
-    def _apply_theme(self) -> None:
-        """Apply theme styling to dialog."""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {self.theme.bg_secondary};
-            }}
-            QLabel {{
-                color: {self.theme.text_primary};
-            }}
-            QGroupBox {{
-                color: {self.theme.text_primary};
-                border: 1px solid {self.theme.border_default};
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 8px;
-                font-weight: 500;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }}
-            QTabWidget::pane {{
-                border: 1px solid {self.theme.border_default};
-                border-radius: 6px;
-                background-color: {self.theme.bg_card};
-            }}
-            QTabBar::tab {{
-                background-color: {self.theme.bg_secondary};
-                color: {self.theme.text_secondary};
-                border: 1px solid {self.theme.border_default};
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {self.theme.bg_card};
-                color: {self.theme.text_primary};
-            }}
-            QComboBox {{
-                background-color: {self.theme.bg_card};
-                color: {self.theme.text_primary};
-                border: 1px solid {self.theme.border_default};
-                border-radius: 4px;
-                padding: 6px 10px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {self.theme.bg_card};
-                color: {self.theme.text_primary};
-                selection-background-color: {self.theme.accent_primary};
-            }}
-            QSpinBox {{
-                background-color: {self.theme.bg_card};
-                color: {self.theme.text_primary};
-                border: 1px solid {self.theme.border_default};
-                border-radius: 4px;
-                padding: 4px 8px;
-            }}
-            QCheckBox {{
-                color: {self.theme.text_primary};
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-                border-radius: 3px;
-                border: 1px solid {self.theme.border_default};
-                background-color: {self.theme.bg_card};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {self.theme.accent_primary};
-                border-color: {self.theme.accent_primary};
-            }}
-            QPushButton {{
-                background-color: {self.theme.bg_card};
-                color: {self.theme.text_primary};
-                border: 1px solid {self.theme.border_default};
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: 500;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme.bg_elevated};
-                border-color: {self.theme.border_hover};
-            }}
-            QPushButton[class="primary"] {{
-                background-color: {self.theme.accent_primary};
-                border-color: {self.theme.accent_primary};
-                color: white;
-            }}
-            QFrame[class="card"] {{
-                background-color: {self.theme.bg_card};
-                border: 1px solid {self.theme.border_default};
-                border-radius: 6px;
-            }}
-        """)
+    @classmethod
+    def get_or_create(
+        cls,
+        settings: AppSettings,
+        theme: ThemeColors,
+        parent: Optional[QWidget] = None
+    ) -> 'SettingsDialog':
+        """Return the dialog of the last call, refreshed, or a new one.
+        
+        Reopening Settings then skips building the tabs again: the cached
+        dialog only takes the new settings and theme and reloads the values
+        of its built tabs. Its colors follow the parent's stylesheet.
+        Connect to its signals once, not on every call.
+        """
+        dialog = cls._instance() if cls._instance is not None else None
+        try:
+            reusable = dialog is not None and dialog.parent() is parent
+        except RuntimeError:
+            # The C++ dialog was deleted along with its old parent
+            reusable = False
+        if not reusable:
+            dialog = cls(settings, theme, parent)
+            cls._instance = weakref.ref(dialog)
+            return dialog
+        dialog.settings = settings
+        dialog.theme = theme
+        dialog._load_settings()
+        return dialog
     
     def _setup_ui(self) -> None:
         """Set up the dialog UI."""
@@ -147,17 +218,32 @@ class SettingsDialog(QDialog):
         
         # Title
         title = QLabel("⚙️ Settings")
-        title.setStyleSheet("font-size: 20px; font-weight: 700;")
+        title.setObjectName("dialogTitle")
         layout.addWidget(title)
         
-        # Tab widget
+        # Tab widget: every tab starts as an empty page and gets its
+        # content (and its settings loaded) when first shown
+        # (create, sync): sync updates the widgets that depend on loaded
+        # values, whose slots are blocked while a tab loads
+        self._tab_builders = [
+            (self._create_appearance_tab, None),
+            (self._create_units_tab, None),
+            (self._create_display_tab, self._sync_display_tab),
+            (self._create_serial_tab, self._sync_serial_tab),
+            (self._create_export_tab, self._sync_export_tab),
+            (self._create_about_tab, None),
+        ]
+        self._built_tabs = set()
+        
         tabs = QTabWidget()
-        tabs.addTab(self._create_appearance_tab(), "🎨 Appearance")
-        tabs.addTab(self._create_units_tab(), "📏 Units")
-        tabs.addTab(self._create_display_tab(), "📊 Display")
-        tabs.addTab(self._create_serial_tab(), "🔌 Serial")
-        tabs.addTab(self._create_export_tab(), "📁 Export")
-        tabs.addTab(self._create_about_tab(), "ℹ️ About")
+        for label in _TAB_LABELS:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            tabs.addTab(page, label)
+        self._tabs = tabs
+        tabs.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(tabs.currentIndex())
         layout.addWidget(tabs)
         
         # Buttons
@@ -177,18 +263,49 @@ class SettingsDialog(QDialog):
         button_layout.addWidget(apply_btn)
         layout.addLayout(button_layout)
     
-    def _create_appearance_tab(self) -> QWidget:
-        """Create appearance settings tab."""
+    def _ensure_tab_built(self, index: int) -> None:
+        """Build the content of tab `index` on first use and load its settings."""
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        self._tabs.widget(index).layout().addWidget(self._tab_builders[index][0]())
+        self._load_tab(index)
+    
+    @staticmethod
+    def _new_tab() -> Tuple[QWidget, QVBoxLayout]:
+        """Create an empty tab page and its vertical layout."""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setSpacing(16)
+        return widget, layout
+    
+    @staticmethod
+    def _new_grid_group(title: str, spacing: int = 12) -> Tuple[QGroupBox, QGridLayout]:
+        """Create a titled group box with a grid layout."""
+        group = QGroupBox(title)
+        grid = QGridLayout(group)
+        grid.setSpacing(spacing)
+        return group, grid
+    
+    @staticmethod
+    def _fill_combo(combo: QComboBox, items: Sequence[str]) -> None:
+        """Give combo a fixed list of items.
+        
+        The items go in as one ready-made QStringListModel (owned by the
+        combo) rather than through the combo's default item model.
+        """
+        combo.setModel(QStringListModel(list(items), combo))
+    
+    def _create_appearance_tab(self) -> QWidget:
+        """Create appearance settings tab."""
+        widget, layout = self._new_tab()
         
         # Theme group
         theme_group = QGroupBox("Theme")
         theme_layout = QVBoxLayout(theme_group)
         
         self.dark_mode_check = QCheckBox("Dark Mode")
-        self.dark_mode_check.setToolTip("Enable dark theme for the application")
+        self.dark_mode_check.setToolTip(_TIP_DARK_MODE)
         theme_layout.addWidget(self.dark_mode_check)
         
         # Theme preview
@@ -198,7 +315,7 @@ class SettingsDialog(QDialog):
         preview_layout = QHBoxLayout(preview_frame)
         
         preview_label = QLabel("Theme Preview")
-        preview_label.setStyleSheet("color: #8b949e;")
+        preview_label.setObjectName("previewLabel")
         preview_layout.addWidget(preview_label)
         
         theme_layout.addWidget(preview_frame)
@@ -209,38 +326,34 @@ class SettingsDialog(QDialog):
     
     def _create_units_tab(self) -> QWidget:
         """Create units settings tab."""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setSpacing(16)
+        widget, layout = self._new_tab()
         
         # Units group
-        units_group = QGroupBox("Measurement Units")
-        grid = QGridLayout(units_group)
-        grid.setSpacing(12)
+        units_group, grid = self._new_grid_group("Measurement Units")
         
         # Voltage
         grid.addWidget(QLabel("Voltage:"), 0, 0)
         self.voltage_unit_combo = QComboBox()
-        self.voltage_unit_combo.addItems(["V", "mV"])
+        self._fill_combo(self.voltage_unit_combo, _VOLTAGE_UNITS)
         grid.addWidget(self.voltage_unit_combo, 0, 1)
         
         # Current
         grid.addWidget(QLabel("Current:"), 1, 0)
         self.current_unit_combo = QComboBox()
-        self.current_unit_combo.addItems(["A", "mA", "µA"])
+        self._fill_combo(self.current_unit_combo, _CURRENT_UNITS)
         grid.addWidget(self.current_unit_combo, 1, 1)
         
         # Power
         grid.addWidget(QLabel("Power:"), 2, 0)
         self.power_unit_combo = QComboBox()
-        self.power_unit_combo.addItems(["W", "mW", "µW"])
+        self._fill_combo(self.power_unit_combo, _POWER_UNITS)
         grid.addWidget(self.power_unit_combo, 2, 1)
         
         layout.addWidget(units_group)
         
         # Info
         info = QLabel("ℹ️ Unit conversion will be applied to displayed values and exports.")
-        info.setStyleSheet("color: #8b949e; font-size: 11px;")
+        info.setObjectName("mutedHint")
         info.setWordWrap(True)
         layout.addWidget(info)
         
@@ -249,26 +362,22 @@ class SettingsDialog(QDialog):
     
     def _create_display_tab(self) -> QWidget:
         """Create display settings tab."""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setSpacing(16)
+        widget, layout = self._new_tab()
         
         # Plot group
-        plot_group = QGroupBox("Plot Settings")
-        grid = QGridLayout(plot_group)
-        grid.setSpacing(12)
+        plot_group, grid = self._new_grid_group("Plot Settings")
         
         # Plot points
         grid.addWidget(QLabel("Max visible points:"), 0, 0)
         self.plot_points_spin = QSpinBox()
         self.plot_points_spin.setRange(500, 50000)
         self.plot_points_spin.setSingleStep(500)
-        self.plot_points_spin.setToolTip("Maximum points rendered in the visible window")
+        self.plot_points_spin.setToolTip(_TIP_PLOT_POINTS)
         grid.addWidget(self.plot_points_spin, 0, 1)
         
         # Show grid
         self.show_grid_check = QCheckBox("Show grid lines")
-        self.show_grid_check.stateChanged.connect(self._on_grid_changed)
+        self.show_grid_check.toggled.connect(self._on_grid_changed)
         grid.addWidget(self.show_grid_check, 1, 0)
         
         # Grid opacity
@@ -277,31 +386,29 @@ class SettingsDialog(QDialog):
         self.grid_alpha_spin.setRange(0.1, 1.0)
         self.grid_alpha_spin.setSingleStep(0.1)
         self.grid_alpha_spin.setDecimals(1)
-        self.grid_alpha_spin.setToolTip("Grid line opacity (0.1 - 1.0)")
+        self.grid_alpha_spin.setToolTip(_TIP_GRID_ALPHA)
         grid.addWidget(self.grid_alpha_spin, 2, 1)
         
         # Crosshair (show values on hover)
         self.show_crosshair_check = QCheckBox("Show cursor values on hover")
-        self.show_crosshair_check.setToolTip("Display V/I/P values when hovering over the graph")
+        self.show_crosshair_check.setToolTip(_TIP_CROSSHAIR)
         grid.addWidget(self.show_crosshair_check, 3, 0, 1, 2)
         
         # Info label about event-driven updates
         info_label = QLabel("📊 Plot updates automatically when new data arrives (up to 60 FPS)")
-        info_label.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
+        info_label.setObjectName("hint")
         info_label.setWordWrap(True)
         grid.addWidget(info_label, 4, 0, 1, 2)
         
         layout.addWidget(plot_group)
         
         # Average Power group
-        avg_group = QGroupBox("Average Power")
-        avg_layout = QGridLayout(avg_group)
-        avg_layout.setSpacing(12)
+        avg_group, avg_layout = self._new_grid_group("Average Power")
         
         # Moving average checkbox
         self.moving_avg_check = QCheckBox("Use moving average")
-        self.moving_avg_check.setToolTip("Use a sliding window average instead of total average")
-        self.moving_avg_check.stateChanged.connect(self._on_moving_avg_changed)
+        self.moving_avg_check.setToolTip(_TIP_MOVING_AVG)
+        self.moving_avg_check.toggled.connect(self._on_moving_avg_changed)
         avg_layout.addWidget(self.moving_avg_check, 0, 0, 1, 2)
         
         # Window size
@@ -309,12 +416,13 @@ class SettingsDialog(QDialog):
         self.moving_avg_spin = QSpinBox()
         self.moving_avg_spin.setRange(10, 1000)
         self.moving_avg_spin.setSingleStep(10)
-        self.moving_avg_spin.setToolTip("Number of samples for moving average")
+        self.moving_avg_spin.setToolTip(_TIP_MOVING_AVG_WINDOW)
+        self.moving_avg_spin.valueChanged.connect(self._on_moving_avg_window_changed)
         avg_layout.addWidget(self.moving_avg_spin, 1, 1)
         
         # Info label
         self.avg_info_label = QLabel()
-        self.avg_info_label.setStyleSheet("color: #8b949e; font-size: 11px;")
+        self.avg_info_label.setObjectName("mutedHint")
         self.avg_info_label.setWordWrap(True)
         avg_layout.addWidget(self.avg_info_label, 2, 0, 1, 2)
         
@@ -326,11 +434,11 @@ class SettingsDialog(QDialog):
         sys_layout.setSpacing(8)
 
         self.show_cpu_usage_check = QCheckBox("Show CPU usage in status bar")
-        self.show_cpu_usage_check.setToolTip("Display a live CPU usage bar near the connection status")
+        self.show_cpu_usage_check.setToolTip(_TIP_CPU_USAGE)
         sys_layout.addWidget(self.show_cpu_usage_check)
 
         sys_info = QLabel("ℹ️ Optional. Uses /proc/stat or psutil if available. Updates ~1 Hz.")
-        sys_info.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
+        sys_info.setObjectName("hint")
         sys_info.setWordWrap(True)
         sys_layout.addWidget(sys_info)
 
@@ -339,41 +447,40 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return widget
     
-    def _on_moving_avg_changed(self, state: int) -> None:
+    def _on_moving_avg_changed(self, enabled: bool) -> None:
         """Update UI when moving average checkbox changes."""
-        enabled = state == Qt.Checked
         self.moving_avg_spin.setEnabled(enabled)
         if enabled:
-            self.avg_info_label.setText(f"Average calculated over last {self.moving_avg_spin.value()} samples.")
+            self._on_moving_avg_window_changed(self.moving_avg_spin.value())
         else:
-            self.avg_info_label.setText("Average calculated over all recorded samples.")
+            self.avg_info_label.setText(_AVG_INFO_TOTAL)
     
-    def _on_grid_changed(self, state: int) -> None:
+    def _on_moving_avg_window_changed(self, window: int) -> None:
+        """Keep the info text in sync with the window size while it applies."""
+        if self.moving_avg_check.isChecked():
+            self.avg_info_label.setText(f"Average calculated over last {window} samples.")
+    
+    def _on_grid_changed(self, enabled: bool) -> None:
         """Update UI when grid checkbox changes."""
-        enabled = state == Qt.Checked
         self.grid_alpha_spin.setEnabled(enabled)
     
     def _create_serial_tab(self) -> QWidget:
         """Create serial settings tab."""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setSpacing(16)
+        widget, layout = self._new_tab()
         
         # Serial group
-        serial_group = QGroupBox("Serial Connection")
-        grid = QGridLayout(serial_group)
-        grid.setSpacing(12)
+        serial_group, grid = self._new_grid_group("Serial Connection")
         
         # Baud rate
         grid.addWidget(QLabel("Baud rate:"), 0, 0)
         self.baud_rate_combo = QComboBox()
-        self.baud_rate_combo.addItems(["9600", "19200", "38400", "57600", "115200", "230400", "460800", "921600"])
+        self._fill_combo(self.baud_rate_combo, _BAUD_RATE_TEXTS)
         grid.addWidget(self.baud_rate_combo, 0, 1)
         
         # Auto reconnect
         self.auto_reconnect_check = QCheckBox("Auto-reconnect on disconnect")
-        self.auto_reconnect_check.setToolTip("Automatically reconnect if the serial port disconnects")
-        self.auto_reconnect_check.stateChanged.connect(self._on_reconnect_changed)
+        self.auto_reconnect_check.setToolTip(_TIP_AUTO_RECONNECT)
+        self.auto_reconnect_check.toggled.connect(self._on_reconnect_changed)
         grid.addWidget(self.auto_reconnect_check, 1, 0, 1, 2)
         
         # Reconnect interval
@@ -381,21 +488,19 @@ class SettingsDialog(QDialog):
         self.reconnect_interval_spin = QSpinBox()
         self.reconnect_interval_spin.setRange(1, 30)
         self.reconnect_interval_spin.setSuffix(" s")
-        self.reconnect_interval_spin.setToolTip("Seconds between reconnection attempts")
+        self.reconnect_interval_spin.setToolTip(_TIP_RECONNECT_INTERVAL)
         grid.addWidget(self.reconnect_interval_spin, 2, 1)
         
         # Info about reconnection
         reconnect_info = QLabel("ℹ️ Uses OS events to detect port changes (efficient, no polling)")
-        reconnect_info.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
+        reconnect_info.setObjectName("hint")
         reconnect_info.setWordWrap(True)
         grid.addWidget(reconnect_info, 3, 0, 1, 2)
         
         layout.addWidget(serial_group)
         
         # Sampling group
-        sampling_group = QGroupBox("Sampling Rate Control")
-        sample_grid = QGridLayout(sampling_group)
-        sample_grid.setSpacing(12)
+        sampling_group, sample_grid = self._new_grid_group("Sampling Rate Control")
         
         # Target sample rate
         sample_grid.addWidget(QLabel("Target sample rate:"), 0, 0)
@@ -403,12 +508,7 @@ class SettingsDialog(QDialog):
         self.target_sample_rate_spin.setRange(0, 1000)
         self.target_sample_rate_spin.setSuffix(" Hz")
         self.target_sample_rate_spin.setSpecialValueText("Maximum (no limit)")
-        self.target_sample_rate_spin.setToolTip(
-            "Target sampling rate in Hz.\n"
-            "• 0 = Maximum device rate (no subsampling)\n"
-            "• < Device max = Subsample to this rate\n"
-            "• > Device max = Use maximum device rate"
-        )
+        self.target_sample_rate_spin.setToolTip(_TIP_TARGET_SAMPLE_RATE)
         sample_grid.addWidget(self.target_sample_rate_spin, 0, 1)
         
         # Device max info
@@ -416,7 +516,7 @@ class SettingsDialog(QDialog):
             "ℹ️ Device maximum: ~360 Hz (ESP32+C3 @1MHz I²C, INA226)\n"
             "Set to 0 for maximum throughput, or lower to reduce data volume"
         )
-        sample_info.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
+        sample_info.setObjectName("hint")
         sample_info.setWordWrap(True)
         sample_grid.addWidget(sample_info, 1, 0, 1, 2)
         
@@ -424,37 +524,27 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return widget
     
-    def _on_reconnect_changed(self, state: int) -> None:
+    def _on_reconnect_changed(self, enabled: bool) -> None:
         """Update UI when auto-reconnect checkbox changes."""
-        enabled = state == Qt.Checked
         self.reconnect_interval_spin.setEnabled(enabled)
     
     def _create_export_tab(self) -> QWidget:
         """Create export settings tab."""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setSpacing(16)
+        widget, layout = self._new_tab()
         
         # CSV group
-        csv_group = QGroupBox("CSV Export")
-        grid = QGridLayout(csv_group)
-        grid.setSpacing(12)
+        csv_group, grid = self._new_grid_group("CSV Export")
         
         # Separator
         grid.addWidget(QLabel("Field separator:"), 0, 0)
         self.csv_separator_combo = QComboBox()
-        self.csv_separator_combo.addItems([", (comma)", "; (semicolon)", "\\t (tab)"])
+        self._fill_combo(self.csv_separator_combo, tuple(_SEP_TO_TEXT.values()))
         grid.addWidget(self.csv_separator_combo, 0, 1)
         
         # Timestamp format
         grid.addWidget(QLabel("Timestamp format:"), 1, 0)
         self.timestamp_format_combo = QComboBox()
-        self.timestamp_format_combo.addItems([
-            "%Y-%m-%d %H:%M:%S.%f",
-            "%Y-%m-%d %H:%M:%S",
-            "%d/%m/%Y %H:%M:%S",
-            "Unix timestamp"
-        ])
+        self._fill_combo(self.timestamp_format_combo, _TIMESTAMP_FORMATS)
         grid.addWidget(self.timestamp_format_combo, 1, 1)
         
         layout.addWidget(csv_group)
@@ -466,27 +556,21 @@ class SettingsDialog(QDialog):
         
         # FFT Analysis
         self.include_fft_check = QCheckBox("Include FFT spectrum analysis")
-        self.include_fft_check.setToolTip(
-            "Add frequency spectrum analysis of current signal to identify\n"
-            "switching noise, ripple, and periodic patterns"
-        )
+        self.include_fft_check.setToolTip(_TIP_FFT)
         pdf_layout.addWidget(self.include_fft_check)
         
         fft_info = QLabel(
             "📊 FFT analysis shows frequency components in the current signal.\n"
             "Useful for identifying: switching frequency, PWM ripple, 50/60Hz noise."
         )
-        fft_info.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
+        fft_info.setObjectName("hint")
         fft_info.setWordWrap(True)
         pdf_layout.addWidget(fft_info)
         
         # Harmonic Analysis
         pdf_layout.addSpacing(8)
         self.include_harmonic_check = QCheckBox("Include harmonic analysis (THD + spectrum)")
-        self.include_harmonic_check.setToolTip(
-            "Add Total Harmonic Distortion analysis and individual harmonic components.\n"
-            "Essential for power quality assessment and compliance testing."
-        )
+        self.include_harmonic_check.setToolTip(_TIP_HARMONIC)
         pdf_layout.addWidget(self.include_harmonic_check)
         
         # Harmonic settings sub-group
@@ -496,23 +580,22 @@ class SettingsDialog(QDialog):
         
         harmonic_grid.addWidget(QLabel("Signal to analyze:"), 0, 0)
         self.harmonic_signal_combo = QComboBox()
-        self.harmonic_signal_combo.addItems(["Current", "Voltage", "Power"])
-        self.harmonic_signal_combo.setToolTip("Select which signal to analyze for harmonics")
+        self._fill_combo(self.harmonic_signal_combo, _HARMONIC_SIGNAL_TEXTS)
+        self.harmonic_signal_combo.setToolTip(_TIP_HARMONIC_SIGNAL)
         harmonic_grid.addWidget(self.harmonic_signal_combo, 0, 1)
         
         harmonic_grid.addWidget(QLabel("Max harmonic order:"), 1, 0)
         self.harmonic_max_order_spin = QSpinBox()
         self.harmonic_max_order_spin.setRange(3, 20)
         self.harmonic_max_order_spin.setValue(10)
-        self.harmonic_max_order_spin.setToolTip("Maximum harmonic order to analyze (1=fundamental)")
+        self.harmonic_max_order_spin.setToolTip(_TIP_HARMONIC_MAX_ORDER)
         harmonic_grid.addWidget(self.harmonic_max_order_spin, 1, 1)
         
         pdf_layout.addWidget(harmonic_settings)
         
         # Enable/disable harmonic settings based on checkbox
-        def toggle_harmonic_settings(checked: bool):
-            harmonic_settings.setEnabled(checked)
-        self.include_harmonic_check.toggled.connect(toggle_harmonic_settings)
+        self._harmonic_settings = harmonic_settings
+        self.include_harmonic_check.toggled.connect(self._on_harmonic_changed)
         harmonic_settings.setEnabled(False)
         
         harmonic_info = QLabel(
@@ -520,7 +603,7 @@ class SettingsDialog(QDialog):
             "and checks compliance with IEC 61000-3-2 limits.\n"
             "Useful for: power supplies, inverters, motor drives, non-linear loads."
         )
-        harmonic_info.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
+        harmonic_info.setObjectName("hint")
         harmonic_info.setWordWrap(True)
         pdf_layout.addWidget(harmonic_info)
         
@@ -529,13 +612,15 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return widget
     
+    def _on_harmonic_changed(self, enabled: bool) -> None:
+        """Update UI when harmonic analysis checkbox changes."""
+        self._harmonic_settings.setEnabled(enabled)
+    
     def _create_about_tab(self) -> QWidget:
         """Create about/info tab with software information."""
         from ...version import __version__, APP_NAME, AUTHOR, DESCRIPTION, URL, LICENSE
         
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setSpacing(16)
+        widget, layout = self._new_tab()
         
         # App info group
         app_group = QGroupBox("Application")
@@ -544,15 +629,15 @@ class SettingsDialog(QDialog):
         
         # App name and version
         name_label = QLabel(f"⚡ {APP_NAME}")
-        name_label.setStyleSheet("font-size: 18px; font-weight: 700;")
+        name_label.setObjectName("appName")
         app_layout.addWidget(name_label)
         
         version_label = QLabel(f"Version {__version__}")
-        version_label.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 14px;")
+        version_label.setObjectName("versionLabel")
         app_layout.addWidget(version_label)
         
         desc_label = QLabel(DESCRIPTION)
-        desc_label.setStyleSheet(f"color: {self.theme.text_secondary};")
+        desc_label.setObjectName("description")
         desc_label.setWordWrap(True)
         app_layout.addWidget(desc_label)
         
@@ -566,9 +651,15 @@ class SettingsDialog(QDialog):
         author_label = QLabel(f"👤 {AUTHOR}")
         author_layout.addWidget(author_label)
         
-        url_label = QLabel(f"🔗 <a href='{URL}' style='color: {self.theme.accent_primary};'>{URL}</a>")
-        url_label.setOpenExternalLinks(True)
-        author_layout.addWidget(url_label)
+        # A flat button rather than a rich-text link: QSS cannot recolor
+        # <a> in a QLabel, and an inline color would keep the theme the
+        # (cached) dialog was created with
+        url_link = QPushButton(f"🔗 {URL}")
+        url_link.setObjectName("urlLink")
+        url_link.setCursor(Qt.PointingHandCursor)
+        url_link.setToolTip(URL)
+        url_link.clicked.connect(lambda: QDesktopServices.openUrl(QUrl(URL)))
+        author_layout.addWidget(url_link, alignment=Qt.AlignLeft)
         
         layout.addWidget(author_group)
         
@@ -580,32 +671,18 @@ class SettingsDialog(QDialog):
         license_layout.addWidget(license_label)
         
         license_info = QLabel("This software is open source. See LICENSE file for details.")
-        license_info.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
+        license_info.setObjectName("hint")
         license_info.setWordWrap(True)
         license_layout.addWidget(license_info)
         
         layout.addWidget(license_group)
         
         # System info
-        import sys
-        import platform
-        
-        sys_group = QGroupBox("System")
-        sys_layout = QGridLayout(sys_group)
-        sys_layout.setSpacing(8)
+        sys_group, sys_layout = self._new_grid_group("System", spacing=8)
         
-        sys_layout.addWidget(QLabel("Python:"), 0, 0)
-        sys_layout.addWidget(QLabel(f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"), 0, 1)
-        
-        sys_layout.addWidget(QLabel("Platform:"), 1, 0)
-        sys_layout.addWidget(QLabel(platform.system()), 1, 1)
-        
-        try:
-            from PySide6 import __version__ as pyside_version
-            sys_layout.addWidget(QLabel("PySide6:"), 2, 0)
-            sys_layout.addWidget(QLabel(pyside_version), 2, 1)
-        except ImportError:
-            pass
+        for row, (name, value) in enumerate(_system_info()):
+            sys_layout.addWidget(QLabel(name), row, 0)
+            sys_layout.addWidget(QLabel(value), row, 1)
         
         layout.addWidget(sys_group)
         
@@ -613,121 +690,78 @@ class SettingsDialog(QDialog):
         return widget
     
     def _load_settings(self) -> None:
-        """Load current settings into UI."""
-        self.dark_mode_check.setChecked(self.settings.dark_mode)
-        
-        # Units
-        idx = self.voltage_unit_combo.findText(self.settings.voltage_unit)
-        if idx >= 0:
-            self.voltage_unit_combo.setCurrentIndex(idx)
-        
-        idx = self.current_unit_combo.findText(self.settings.current_unit)
-        if idx >= 0:
-            self.current_unit_combo.setCurrentIndex(idx)
-        
-        idx = self.power_unit_combo.findText(self.settings.power_unit)
-        if idx >= 0:
-            self.power_unit_combo.setCurrentIndex(idx)
-        
-        # Display
-        self.plot_points_spin.setValue(self.settings.plot_points)
-        self.show_grid_check.setChecked(self.settings.show_grid)
-        self.show_cpu_usage_check.setChecked(self.settings.show_cpu_usage)
-        
-        # Moving average
-        self.moving_avg_check.setChecked(self.settings.use_moving_average)
-        self.moving_avg_spin.setValue(self.settings.moving_average_window)
-        self.moving_avg_spin.setEnabled(self.settings.use_moving_average)
-        self._on_moving_avg_changed(Qt.Checked if self.settings.use_moving_average else Qt.Unchecked)
-        
-        # Serial
-        idx = self.baud_rate_combo.findText(str(self.settings.baud_rate))
-        if idx >= 0:
-            self.baud_rate_combo.setCurrentIndex(idx)
-        self.auto_reconnect_check.setChecked(self.settings.auto_reconnect)
-        self.reconnect_interval_spin.setValue(self.settings.reconnect_interval)
-        
-        # Sampling
-        self.target_sample_rate_spin.setValue(self.settings.target_sample_rate)
-        
-        # Export - map separator back to display text
-        sep_map = {",": ", (comma)", ";": "; (semicolon)", "\t": "\\t (tab)"}
-        sep_text = sep_map.get(self.settings.csv_separator, ", (comma)")
-        idx = self.csv_separator_combo.findText(sep_text)
-        if idx >= 0:
-            self.csv_separator_combo.setCurrentIndex(idx)
-        
-        # Display - grid and crosshair
-        self.grid_alpha_spin.setValue(self.settings.grid_alpha)
-        self.grid_alpha_spin.setEnabled(self.settings.show_grid)
-        self.show_crosshair_check.setChecked(self.settings.show_crosshair)
-        
-        # Serial - reconnect interval
-        self.reconnect_interval_spin.setValue(self.settings.reconnect_interval)
-        self.reconnect_interval_spin.setEnabled(self.settings.auto_reconnect)
-        
-        # Export - FFT
-        self.include_fft_check.setChecked(self.settings.include_fft)
-        
-        # Export - Harmonic Analysis
-        self.include_harmonic_check.setChecked(self.settings.include_harmonic_analysis)
-        self.harmonic_max_order_spin.setValue(self.settings.harmonic_max_order)
-        
-        # Map signal type to combo index
-        signal_map = {"current": 0, "voltage": 1, "power": 2}
-        signal_idx = signal_map.get(self.settings.harmonic_signal.lower(), 0)
-        self.harmonic_signal_combo.setCurrentIndex(signal_idx)
+        """Load current settings into the tabs built so far."""
+        for index in sorted(self._built_tabs):
+            self._load_tab(index)
+    
+    def _load_tab(self, index: int) -> None:
+        """Show the settings bound to tab `index` in its widgets."""
+        bindings = _TAB_BINDINGS[index]
+        widgets = [getattr(self, binding[0]) for binding in bindings]
+        
+        # Blocked while loading, then the dependent widgets are synced once
+        blockers = [QSignalBlocker(w) for w in widgets]
+        for w, (_, field, values, index_map) in zip(widgets, bindings):
+            value = getattr(self.settings, field)
+            if values is None:
+                _SETTERS[type(w)](w, value)
+            else:
+                # Unknown values leave the combo as it is
+                idx = index_map.get(value)
+                if idx is not None:
+                    w.setCurrentIndex(idx)
+        del blockers
+        
+        sync = self._tab_builders[index][1]
+        if sync is not None:
+            sync()
+    
+    def _sync_display_tab(self) -> None:
+        self._on_grid_changed(self.show_grid_check.isChecked())
+        self._on_moving_avg_changed(self.moving_avg_check.isChecked())
+    
+    def _sync_serial_tab(self) -> None:
+        self._on_reconnect_changed(self.auto_reconnect_check.isChecked())
+    
+    def _sync_export_tab(self) -> None:
+        self._on_harmonic_changed(self.include_harmonic_check.isChecked())
     
     def _apply_settings(self) -> None:
-        """Apply settings and close dialog."""
-        old_dark_mode = self.settings.dark_mode
-        
-        # Theme
-        self.settings.dark_mode = self.dark_mode_check.isChecked()
-        
-        # Units
-        self.settings.voltage_unit = self.voltage_unit_combo.currentText()
-        self.settings.current_unit = self.current_unit_combo.currentText()
-        self.settings.power_unit = self.power_unit_combo.currentText()
-        
-        # Display
-        self.settings.plot_points = self.plot_points_spin.value()
-        self.settings.show_grid = self.show_grid_check.isChecked()
-        self.settings.grid_alpha = self.grid_alpha_spin.value()
-        self.settings.show_crosshair = self.show_crosshair_check.isChecked()
-        self.settings.show_cpu_usage = self.show_cpu_usage_check.isChecked()
-        
-        # Moving average
-        self.settings.use_moving_average = self.moving_avg_check.isChecked()
-        self.settings.moving_average_window = self.moving_avg_spin.value()
-        
-        # Serial
-        self.settings.baud_rate = int(self.baud_rate_combo.currentText())
-        self.settings.auto_reconnect = self.auto_reconnect_check.isChecked()
-        self.settings.reconnect_interval = self.reconnect_interval_spin.value()
-        
-        # Sampling
-        self.settings.target_sample_rate = self.target_sample_rate_spin.value()
-        
-        # Export
-        sep_text = self.csv_separator_combo.currentText()
-        sep_map = {", (comma)": ",", "; (semicolon)": ";", "\\t (tab)": "\t"}
-        self.settings.csv_separator = sep_map.get(sep_text, ",")
-        self.settings.timestamp_format = self.timestamp_format_combo.currentText()
-        self.settings.include_fft = self.include_fft_check.isChecked()
-        
-        # Harmonic Analysis
-        self.settings.include_harmonic_analysis = self.include_harmonic_check.isChecked()
-        self.settings.harmonic_max_order = self.harmonic_max_order_spin.value()
-        
-        # Map combo index to signal type
-        signal_types = ["current", "voltage", "power"]
-        self.settings.harmonic_signal = signal_types[self.harmonic_signal_combo.currentIndex()]
+        """Apply settings and close dialog.
+        
+        Tabs that were never opened leave their settings untouched. Nothing
+        is emitted when the stored values match the previous ones, so an
+        Apply without edits costs listeners no work; otherwise
+        settings_changed carries the names of the fields that changed so
+        listeners can skip unaffected updates.
+        """
+        old = replace(self.settings)
+        
+        for index in sorted(self._built_tabs):
+            self._store_tab(index)
+        
+        changed = frozenset(
+            f.name for f in fields(old)
+            if getattr(old, f.name) != getattr(self.settings, f.name)
+        )
+        if not changed:
+            self.accept()
+            return
         
         # Emit signals
-        self.settings_changed.emit(self.settings)
+        self.settings_changed.emit(self.settings, changed)
         
-        if self.settings.dark_mode != old_dark_mode:
+        if self.settings.dark_mode != old.dark_mode:
             self.theme_changed.emit(self.settings.dark_mode)
         
         self.accept()
+    
+    def _store_tab(self, index: int) -> None:
+        """Copy the widget values of tab `index` into the settings."""
+        for attr, field, values, _ in _TAB_BINDINGS[index]:
+            w = getattr(self, attr)
+            if values is None:
+                value = _GETTERS[type(w)](w)
+            else:
+                value = values[w.currentIndex()]
+            setattr(self.settings, field, value)
@@ -7,20 +7,63 @@ and export capabilities.
 from __future__ import annotations
 
 import time
-from collections import deque
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Deque
+from typing import Any, Callable, List, Optional, Set, Tuple
 
+import numpy as np
 from PySide6 import QtCore, QtWidgets, QtGui
 
 from ..serial import SerialReader
-from ..core import AppSettings, Statistics, MeasurementRecord, CPUUsageMonitor
-from ..export import ReportGenerator, CSVImporter
+from ..core import (
+    AppSettings, Statistics, MeasurementBuffer, MeasurementTable,
+    CPUUsageMonitor,
+)
+from ..export import ReportGenerator, CSVImporter, render_pdf
 from ..version import __version__, APP_NAME
 from .theme import ThemeColors, DARK_THEME, LIGHT_THEME, generate_stylesheet
 from .dialogs import SettingsDialog
 from .widgets import PlotBuffers, PlotWidget, StatCard, PortDiscovery, CPUBar
+from .workers import FunctionWorker, WorkerSignals
+
+
+_CURSOR_FMT = "T: {:.3f}s | V: {:.4f}V | I: {:.4f}A | P: {:.4f}W"
+
+_APP_ICON: Optional[QtGui.QIcon] = None
+
+
+def _get_app_icon() -> QtGui.QIcon:
+    """Load the window icon once per process (null icon if missing)."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        # Handle both development and PyInstaller bundle
+        import sys
+        if getattr(sys, 'frozen', False):
+            # Running as PyInstaller bundle
+            base_path = Path(sys._MEIPASS)
+        else:
+            # Running in development
+            base_path = Path(__file__).parent.parent.parent
+        
+        icon_path = base_path / "assets" / "icons" / "icon.png"
+        _APP_ICON = QtGui.QIcon(str(icon_path)) if icon_path.exists() else QtGui.QIcon()
+    return _APP_ICON
+
+
+def _set_tone(label: QtWidgets.QLabel, tone: str) -> None:
+    """Recolor a label through its stylesheet "tone" property.
+    
+    Cheaper than setStyleSheet(): only this widget is re-polished against
+    the already-parsed window stylesheet.
+    """
+    if label.property("tone") == tone:
+        return
+    label.setProperty("tone", tone)
+    style = label.style()
+    style.unpolish(label)
+    style.polish(label)
 
 
 # =============================================================================
@@ -31,8 +74,13 @@ class MainWindow(QtWidgets.QMainWindow):
     """Main application window."""
     
     MIN_PLOT_INTERVAL_MS = 16  # Max 60 FPS (~16ms between updates)
+    STATS_INTERVAL_MS = 100  # Stat cards / sample counter refresh (10 Hz)
     STOP_TIMEOUT_MS = 3000
     MAX_DATA_POINTS = 100000  # Max points before warning
+    NETLINK_KOBJECT_UEVENT = 15  # Linux netlink protocol for device uevents
+    UEVENT_KERNEL_GROUP = 1  # Multicast group of raw kernel events
+    UEVENT_UDEV_GROUP = 2  # Multicast group of udev-processed events
+    UDEV_CONTROL_PATH = '/run/udev/control'  # Present while udevd runs
     
     def __init__(self):
         super().__init__()
@@ -41,13 +89,15 @@ class MainWindow(QtWidgets.QMainWindow):
         self._apply_loaded_settings()
         self._connect_signals()
         self._setup_plot_throttle()
+        self._setup_stats_timer()
+        self._setup_cursor_timer()
         self._setup_port_monitor()
         self._refresh_ports()
     
     def _init_state(self) -> None:
         self.reader: Optional[SerialReader] = None
-        self.buffers = PlotBuffers()
-        self.full_data: List[MeasurementRecord] = []
+        self.full_data = MeasurementBuffer()
+        self.buffers = PlotBuffers(self.full_data)
         self.report_generator = ReportGenerator()
         
         # Load settings from persistent storage
@@ -57,39 +107,45 @@ class MainWindow(QtWidgets.QMainWindow):
         # Flag to track if we're actively acquiring
         self._acquiring = False
         self._acq_start_time: float = 0.0  # perf_counter at acquisition start
+        self._acq_t0_unix: Optional[float] = None  # Unix time at rel_time == 0
         
         # Rate limiting for plot updates (max 60 FPS)
         self._last_plot_update: float = 0.0
         
-        # Running statistics for efficient avg power calculation
-        self._power_sum: float = 0.0
-        self._power_window: Deque[float] = deque(maxlen=1000)  # For moving average
+        # Moving-average length in samples; averages come from the power
+        # prefix sum in full_data, so no sample window is kept here
+        self._power_window_len: int = 1000
         
         # Auto-reconnect state
         self._last_port: Optional[str] = None
         self._reconnect_timer: Optional[QtCore.QTimer] = None
+        self._port_monitor_enabled = False
+        self._port_check_timer: Optional[QtCore.QTimer] = None
+        self._port_watcher: Optional[QtCore.QFileSystemWatcher] = None
+        self._uevent_notifier: Optional[QtCore.QSocketNotifier] = None
+        self._uevent_sock = None  # socket.socket (AF_NETLINK) while monitoring
 
         # CPU monitor
         self.cpu_monitor = CPUUsageMonitor()
         self._cpu_timer: Optional[QtCore.QTimer] = None
+        
+        # Signals of running background tasks (import/export)
+        self._active_workers: Set[WorkerSignals] = set()
+        
+        # Process that renders PDF reports (started on first export)
+        self._pdf_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Settings dialog, kept and reused once opened
+        self._settings_dialog: Optional[SettingsDialog] = None
     
     def _setup_ui(self) -> None:
         self.setWindowTitle(f"{APP_NAME} v{__version__}")
         self.setMinimumSize(1200, 800)
         self.resize(1400, 900)
         
-        # Set window icon - handle both development and PyInstaller bundle
-        import sys
-        if getattr(sys, 'frozen', False):
-            # Running as PyInstaller bundle
-            base_path = Path(sys._MEIPASS)
-        else:
-            # Running in development
-            base_path = Path(__file__).parent.parent.parent
-        
-        icon_path = base_path / "assets" / "icons" / "icon.png"
-        if icon_path.exists():
-            self.setWindowIcon(QtGui.QIcon(str(icon_path)))
+        icon = _get_app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
         
         self._apply_theme()
         
@@ -128,7 +184,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.report_generator.harmonic_signal = s.harmonic_signal
         
         # Power window for moving average
-        self._power_window = deque(maxlen=s.moving_average_window)
+        self._resize_power_window(s.moving_average_window)
 
         # CPU monitor toggle
         self._update_cpu_monitor_enabled()
@@ -230,15 +286,18 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.addWidget(sel_title)
         
         self.sel_samples_label = QtWidgets.QLabel("Samples: --")
-        self.sel_samples_label.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
+        self.sel_samples_label.setProperty("class", "caption")
+        self.sel_samples_label.setProperty("tone", "secondary")
         layout.addWidget(self.sel_samples_label)
         
         self.sel_duration_label = QtWidgets.QLabel("Duration: --")
-        self.sel_duration_label.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
+        self.sel_duration_label.setProperty("class", "caption")
+        self.sel_duration_label.setProperty("tone", "secondary")
         layout.addWidget(self.sel_duration_label)
         
         self.sel_power_label = QtWidgets.QLabel("Avg Power: --")
-        self.sel_power_label.setStyleSheet(f"color: {self.theme.chart_power}; font-size: 11px;")
+        self.sel_power_label.setProperty("class", "caption")
+        self.sel_power_label.setProperty("tone", "power")
         layout.addWidget(self.sel_power_label)
         
         layout.addStretch()
@@ -290,15 +349,16 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.setContentsMargins(4, 0, 4, 0)
         
         self.status_label = QtWidgets.QLabel("● Disconnected")
-        self.status_label.setStyleSheet(f"color: {self.theme.text_muted};")
+        self.status_label.setProperty("tone", "muted")
         layout.addWidget(self.status_label)
 
         # CPU usage indicator (hidden unless enabled in settings)
         self.cpu_label = QtWidgets.QLabel("CPU")
-        self.cpu_label.setStyleSheet(f"color: {self.theme.text_secondary};")
+        self.cpu_label.setProperty("tone", "secondary")
         self.cpu_bar = CPUBar(bar_count=6)
         self.cpu_pct = QtWidgets.QLabel("--%")
-        self.cpu_pct.setStyleSheet(f"color: {self.theme.text_secondary}; font-family: monospace;")
+        self.cpu_pct.setProperty("class", "mono")
+        self.cpu_pct.setProperty("tone", "secondary")
         layout.addSpacing(12)
         layout.addWidget(self.cpu_label)
         layout.addWidget(self.cpu_bar)
@@ -312,16 +372,15 @@ class MainWindow(QtWidgets.QMainWindow):
         
         # Cursor values display
         self.cursor_label = QtWidgets.QLabel("")
-        self.cursor_label.setStyleSheet(f"color: {self.theme.text_secondary}; font-family: monospace;")
+        self.cursor_label.setProperty("class", "mono")
+        self.cursor_label.setProperty("tone", "secondary")
         layout.addWidget(self.cursor_label)
         
         layout.addSpacing(20)
         
         self.samples_label = QtWidgets.QLabel("Samples: 0")
-        self.samples_label.setStyleSheet(f"color: {self.theme.text_secondary};")
-        self.cpu_label.setStyleSheet(f"color: {self.theme.text_secondary};")
-        # Use existing border color as background track
-        self.cpu_bar.set_colors(self.theme.accent_primary, self.theme.border_default)
+        self.samples_label.setProperty("tone", "secondary")
+        self._update_cpu_bar_colors()
         layout.addWidget(self.samples_label)
         
         parent.addLayout(layout)
@@ -347,13 +406,27 @@ class MainWindow(QtWidgets.QMainWindow):
         self.plot_widget.cursor_values.connect(self._on_cursor_values)
     
     def _on_cursor_values(self, t: float, v: float, i: float, p: float) -> None:
+        """Queue cursor values; the label is refreshed at most once per frame."""
+        self._cursor_pending = (t, v, i, p)
+        if not self._cursor_timer.isActive():
+            self._cursor_timer.start()
+    
+    def _flush_cursor_values(self) -> None:
         """Update cursor values display."""
-        self.cursor_label.setText(
-            f"T: {t:.3f}s | V: {v:.4f}V | I: {i:.4f}A | P: {p:.4f}W"
-        )
+        if self._cursor_pending is not None:
+            self.cursor_label.setText(_CURSOR_FMT.format(*self._cursor_pending))
+            self._cursor_pending = None
     
     def _setup_port_monitor(self) -> None:
-        """Setup OS-level port change monitoring for auto-reconnect."""
+        """Setup OS-level port change monitoring for auto-reconnect.
+        
+        Nothing is installed while auto-reconnect is disabled.
+        """
+        self._teardown_port_monitor()
+        self._port_monitor_enabled = self.settings.auto_reconnect
+        if not self._port_monitor_enabled:
+            return
+        
         import sys
         if sys.platform == 'linux':
             self._setup_linux_port_monitor()
@@ -363,14 +436,36 @@ class MainWindow(QtWidgets.QMainWindow):
             self._port_check_timer.timeout.connect(self._check_port_availability)
             self._port_check_timer.start(2000)  # Check every 2 seconds
     
+    def _teardown_port_monitor(self) -> None:
+        """Stop and release whichever port monitor is installed."""
+        if self._port_check_timer is not None:
+            self._port_check_timer.stop()
+            self._port_check_timer.deleteLater()
+            self._port_check_timer = None
+        if self._port_watcher is not None:
+            self._port_watcher.deleteLater()
+            self._port_watcher = None
+        if self._uevent_notifier is not None:
+            self._uevent_notifier.setEnabled(False)
+            self._uevent_notifier.deleteLater()
+            self._uevent_notifier = None
+            self._uevent_sock.close()
+            self._uevent_sock = None
+    
     def _setup_linux_port_monitor(self) -> None:
-        """Use inotify to watch for USB device changes on Linux."""
+        """Listen for tty hotplug uevents on Linux.
+        
+        Prefers a netlink uevent socket, which only wakes us for real
+        device add/remove events, over watching /dev (busy on most systems).
+        """
+        try:
+            self._setup_uevent_monitor()
+            return
+        except Exception:
+            pass
+        
         try:
-            from PySide6.QtCore import QSocketNotifier
             import os
-            
-            # Watch /dev for device changes
-            # We use a simpler approach: QFileSystemWatcher on /dev/serial/by-id
             from PySide6.QtCore import QFileSystemWatcher
             
             self._port_watcher = QFileSystemWatcher()
@@ -388,6 +483,55 @@ class MainWindow(QtWidgets.QMainWindow):
             self._port_check_timer.timeout.connect(self._check_port_availability)
             self._port_check_timer.start(2000)
     
+    def _setup_uevent_monitor(self) -> None:
+        """Subscribe to netlink uevents via a QSocketNotifier.
+        
+        With udevd running, listen to its group so the event arrives once
+        the /dev node and by-id links exist; without it (containers,
+        minimal systems) nothing is ever sent there, so take the kernel's
+        own events instead (devtmpfs has created the node by then).
+        """
+        import os
+        import socket
+        
+        if os.path.exists(self.UDEV_CONTROL_PATH):
+            group = self.UEVENT_UDEV_GROUP
+        else:
+            group = self.UEVENT_KERNEL_GROUP
+        sock = socket.socket(
+            socket.AF_NETLINK, socket.SOCK_RAW, self.NETLINK_KOBJECT_UEVENT
+        )
+        try:
+            sock.bind((0, group))
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+        
+        self._uevent_sock = sock
+        self._uevent_notifier = QtCore.QSocketNotifier(
+            sock.fileno(), QtCore.QSocketNotifier.Type.Read, self
+        )
+        self._uevent_notifier.activated.connect(self._on_uevent)
+    
+    def _on_uevent(self) -> None:
+        """Drain pending uevents and refresh on tty add/remove."""
+        changed = False
+        while True:
+            try:
+                msg = self._uevent_sock.recv(8192)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # ENOBUFS on event storms: just rescan
+                changed = True
+                break
+            if (b'SUBSYSTEM=tty\0' in msg and
+                    (b'ACTION=add\0' in msg or b'ACTION=remove\0' in msg)):
+                changed = True
+        if changed:
+            self._on_port_change('')
+    
     def _on_port_change(self, path: str) -> None:
         """Called when serial port directory changes."""
         # Refresh port list
@@ -419,7 +563,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         if self._last_port in available:
             self.status_label.setText(f"● Reconnecting to {self._last_port}...")
-            self.status_label.setStyleSheet(f"color: {self.theme.accent_warning};")
+            _set_tone(self.status_label, "warning")
             
             # Set port in combo box
             for i in range(self.port_combo.count()):
@@ -437,6 +581,20 @@ class MainWindow(QtWidgets.QMainWindow):
         self._plot_timer.setSingleShot(True)
         self._plot_timer.timeout.connect(self._do_plot_update)
     
+    def _setup_stats_timer(self) -> None:
+        """Setup fixed-rate refresh of live stat cards, independent of sample rate."""
+        self._stats_timer = QtCore.QTimer()
+        self._stats_timer.setInterval(self.STATS_INTERVAL_MS)
+        self._stats_timer.timeout.connect(self._refresh_stats)
+    
+    def _setup_cursor_timer(self) -> None:
+        """Setup coalescing of crosshair updates to the display frame rate."""
+        self._cursor_pending: Optional[Tuple[float, float, float, float]] = None
+        self._cursor_timer = QtCore.QTimer()
+        self._cursor_timer.setSingleShot(True)
+        self._cursor_timer.setInterval(self.MIN_PLOT_INTERVAL_MS)
+        self._cursor_timer.timeout.connect(self._flush_cursor_values)
+    
     def _request_plot_update(self) -> None:
         """Request a plot update (rate-limited to 60 FPS max)."""
         now = time.perf_counter()
@@ -463,9 +621,11 @@ class MainWindow(QtWidgets.QMainWindow):
     # -------------------------------------------------------------------------
     
     def _open_settings(self) -> None:
-        dialog = SettingsDialog(self.settings, self.theme, self)
-        dialog.theme_changed.connect(self._on_theme_changed)
-        dialog.settings_changed.connect(self._on_settings_changed)
+        dialog = SettingsDialog.get_or_create(self.settings, self.theme, self)
+        if dialog is not self._settings_dialog:
+            dialog.theme_changed.connect(self._on_theme_changed)
+            dialog.settings_changed.connect(self._on_settings_changed)
+            self._settings_dialog = dialog
         dialog.exec()
     
     def _on_theme_changed(self, dark_mode: bool) -> None:
@@ -478,18 +638,16 @@ class MainWindow(QtWidgets.QMainWindow):
         """Update widgets with theme colors."""
         self.plot_widget.update_theme(self.theme)
         
-        connected = self._is_connected()
-        self.status_label.setStyleSheet(
-            f"color: {self.theme.accent_success if connected else self.theme.text_muted};"
-        )
-        self.samples_label.setStyleSheet(f"color: {self.theme.text_secondary};")
-        self.sel_samples_label.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
-        self.sel_duration_label.setStyleSheet(f"color: {self.theme.text_secondary}; font-size: 11px;")
-        self.sel_power_label.setStyleSheet(f"color: {self.theme.chart_power}; font-size: 11px;")
-        
+        # Status/info labels follow the window stylesheet via their "tone"
+        # property; stat cards carry their own color
         self.voltage_card.value_label.setStyleSheet(f"color: {self.theme.chart_voltage};")
         self.current_card.value_label.setStyleSheet(f"color: {self.theme.chart_current};")
         self.power_card.value_label.setStyleSheet(f"color: {self.theme.chart_power};")
+        self._update_cpu_bar_colors()
+    
+    def _update_cpu_bar_colors(self) -> None:
+        # Use existing border color as background track
+        self.cpu_bar.set_colors(self.theme.accent_primary, self.theme.border_default)
 
     def _update_cpu_monitor_enabled(self) -> None:
         """Show/hide and start/stop CPU usage indicator based on settings."""
@@ -517,17 +675,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self.cpu_bar.set_usage(usage)
         self.cpu_pct.setText(f"{usage:.0f}%")
     
-    def _on_settings_changed(self, settings: AppSettings) -> None:
+    def _on_settings_changed(self, settings: AppSettings, changed: frozenset) -> None:
         self.settings = settings
         self.buffers.max_points = settings.plot_points
         
         # Update power window size for moving average
-        new_window = deque(self._power_window, maxlen=settings.moving_average_window)
-        self._power_window = new_window
+        self._resize_power_window(settings.moving_average_window)
         
         # Update plot widget settings
-        self.plot_widget.set_grid(settings.show_grid, settings.grid_alpha)
-        self.plot_widget.set_crosshair(settings.show_crosshair)
+        if not changed.isdisjoint(("show_grid", "grid_alpha")):
+            self.plot_widget.set_grid(settings.show_grid, settings.grid_alpha)
+        if "show_crosshair" in changed:
+            self.plot_widget.set_crosshair(settings.show_crosshair)
         
         # Update report generator FFT setting
         self.report_generator.include_fft = settings.include_fft
@@ -536,7 +695,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.report_generator.harmonic_signal = settings.harmonic_signal
 
         # CPU monitor toggle
-        self._update_cpu_monitor_enabled()
+        if "show_cpu_usage" in changed:
+            self._update_cpu_monitor_enabled()
+        
+        # Port monitor only runs while auto-reconnect is on
+        if settings.auto_reconnect != self._port_monitor_enabled:
+            self._setup_port_monitor()
         
         # Save settings to persistent storage
         settings.save()
@@ -574,7 +738,7 @@ class MainWindow(QtWidgets.QMainWindow):
         # Make sure any previous reader is fully stopped
         if self.reader is not None:
             try:
-                self.reader.data_received.disconnect(self._on_data)
+                self.reader.batch_received.disconnect(self._on_batch)
                 self.reader.error.disconnect(self._on_error)
             except RuntimeError:
                 pass
@@ -595,13 +759,17 @@ class MainWindow(QtWidgets.QMainWindow):
             target_sample_rate=self.settings.target_sample_rate,
             max_device_rate=self.settings.max_device_sample_rate,
         )
-        self.reader.data_received.connect(self._on_data, QtCore.Qt.QueuedConnection)
+        self.reader.batch_received.connect(self._on_batch, QtCore.Qt.QueuedConnection)
         self.reader.error.connect(self._on_error, QtCore.Qt.QueuedConnection)
+        
+        # Record start time before the reader stamps its first sample
+        self._acq_start_time = time.perf_counter()
+        self._acq_t0_unix = None
         self.reader.start()
         
-        # Now we're acquiring - record start time
+        # Now we're acquiring
         self._acquiring = True
-        self._acq_start_time = time.perf_counter()
+        self._stats_timer.start()
         
         self.connect_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
@@ -612,28 +780,30 @@ class MainWindow(QtWidgets.QMainWindow):
         self.select_all_btn.setEnabled(False)
         
         self.status_label.setText(f"● Connected: {port}")
-        self.status_label.setStyleSheet(f"color: {self.theme.accent_success};")
+        _set_tone(self.status_label, "success")
     
     def _stop_acquisition(self) -> None:
-        # Stop acquiring first
-        self._acquiring = False
-        
         if self.reader:
-            # Disconnect signals first to avoid race conditions
+            # Stop the thread while still connected so its final partial
+            # batch is queued, then deliver it before disconnecting
+            self.reader.stop(self.STOP_TIMEOUT_MS)
+            QtCore.QCoreApplication.sendPostedEvents(self)
             try:
-                self.reader.data_received.disconnect(self._on_data)
+                self.reader.batch_received.disconnect(self._on_batch)
                 self.reader.error.disconnect(self._on_error)
             except RuntimeError:
                 pass  # Already disconnected
-            
-            self.reader.stop(self.STOP_TIMEOUT_MS)
             self.reader = None
         
+        self._acquiring = False
+        self._stats_timer.stop()
+        self._refresh_stats()  # Show final values
+        
         self.connect_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         
         self.status_label.setText("● Disconnected")
-        self.status_label.setStyleSheet(f"color: {self.theme.text_muted};")
+        _set_tone(self.status_label, "muted")
         
         # Enable export after stopping if we have data
         if self.full_data:
@@ -644,40 +814,44 @@ class MainWindow(QtWidgets.QMainWindow):
     # Data Handling
     # -------------------------------------------------------------------------
     
-    def _on_data(self, data: dict) -> None:
+    def _on_batch(self, samples: np.ndarray, first_unix: float) -> None:
+        """Store a batch of samples from the reader thread.
+        
+        Args:
+            samples: (n, 4) array of (perf_counter time, V, I, P)
+            first_unix: Firmware unix time of the first sample
+        """
         # Ignore data if we're not actively acquiring
         if not self._acquiring:
             return
         
-        # Use local perf_counter for relative time (reliable, no RTC issues)
-        rel_time = time.perf_counter() - self._acq_start_time
-        
-        # Keep firmware timestamp for export
-        ts = data['timestamp']
-        unix_time = ts.timestamp() if ts else time.time()
-        
-        v, i, p = data['voltage'], data['current'], data['power']
+        # Local perf_counter stamped by the reader (reliable, no RTC issues)
+        rel_time = samples[:, 0] - self._acq_start_time
         
-        # Use relative time for plotting
-        self.buffers.append(rel_time, v, i, p)
+        # Anchor to the firmware clock once per acquisition
+        if self._acq_t0_unix is None:
+            self._acq_t0_unix = first_unix - rel_time[0]
         
-        self.full_data.append(MeasurementRecord(ts, unix_time, rel_time, v, i, p))
-        
-        # Update running statistics
-        self._power_sum += p
-        self._power_window.append(p)
+        # Single write; self.buffers is a view over full_data
+        self.full_data.extend(
+            self._acq_t0_unix + rel_time, rel_time,
+            samples[:, 1], samples[:, 2], samples[:, 3],
+        )
         
         # Request plot update (rate-limited to 60 FPS)
         self._request_plot_update()
-        
-        # Update stat cards every 5 samples (~20Hz at 100Hz input)
+    
+    def _refresh_stats(self) -> None:
+        """Refresh stat cards and sample counter from the latest sample."""
         n = len(self.full_data)
-        if n % 5 == 0:
-            self._update_stat_cards(v, i, p)
-        
-        # Update sample count every 50 samples
-        if n % 50 == 0:
-            self.samples_label.setText(f"Samples: {n:,}")
+        if n == 0:
+            return
+        self._update_stat_cards(
+            self.full_data.voltage[-1],
+            self.full_data.current[-1],
+            self.full_data.power[-1],
+        )
+        self.samples_label.setText(f"Samples: {n:,}")
     
     def _update_stat_cards(self, v: float, i: float, p: float) -> None:
         """Update the stat cards with current values."""
@@ -687,39 +861,39 @@ class MainWindow(QtWidgets.QMainWindow):
         self.avg_power_card.set_value(self._calculate_avg_power())
         
         # Calculate and display sample rate
-        if len(self.full_data) >= 2:
+        rel = self.full_data.relative_time
+        if len(rel) >= 2:
             # Use last 50 samples for accurate rate calculation
-            recent_samples = min(50, len(self.full_data))
-            time_diff = self.full_data[-1].relative_time - self.full_data[-recent_samples].relative_time
+            recent_samples = min(50, len(rel))
+            time_diff = rel[-1] - rel[-recent_samples]
             if time_diff > 0:
                 sample_rate = (recent_samples - 1) / time_diff
                 self.sample_rate_card.set_value(sample_rate)
     
     def _calculate_avg_power(self) -> float:
-        """Calculate average power efficiently using running statistics."""
-        if not self.full_data:
+        """Calculate average power from the buffer's power prefix sum."""
+        n = len(self.full_data)
+        if n == 0:
             return 0.0
         
         if self.settings.use_moving_average:
-            # Moving average using deque - O(1)
-            if self._power_window:
-                return sum(self._power_window) / len(self._power_window)
-            return 0.0
+            # Moving average over the last window - O(1)
+            i0 = max(0, n - self._power_window_len)
+            return self.full_data.power_sum(i0, n) / (n - i0)
         else:
-            # Total average using running sum - O(1)
-            return self._power_sum / len(self.full_data)
+            # Total average - O(1)
+            return self.full_data.power_sum() / n
+    
+    def _resize_power_window(self, length: int) -> None:
+        """Set the moving-average length. O(1): there is no window to copy."""
+        self._power_window_len = max(1, length)
     
     def _on_error(self, msg: str) -> None:
         QtWidgets.QMessageBox.critical(self, "Serial Error", msg)
         self._stop_acquisition()
     
     def _clear_data(self) -> None:
-        self.buffers.clear()
-        self.full_data = []
-        
-        # Reset running statistics
-        self._power_sum = 0.0
-        self._power_window.clear()
+        self.full_data.clear()
         
         self.plot_widget.clear_data()
         self.select_all_btn.setEnabled(False)
@@ -754,8 +928,8 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         
         # Use relative time for region selector (starts from 0)
-        t_min = self.full_data[0].relative_time
-        t_max = self.full_data[-1].relative_time
+        rel = self.full_data.relative_time
+        t_min, t_max = rel[0], rel[-1]
         
         # Reset view to show all data before adding region selector
         self.plot_widget.show_full_range(t_min, t_max)
@@ -777,32 +951,37 @@ class MainWindow(QtWidgets.QMainWindow):
     def _select_all(self) -> None:
         if not self.full_data:
             return
-        t_min = self.full_data[0].relative_time
-        t_max = self.full_data[-1].relative_time
-        self.plot_widget.add_region_selector(t_min, t_max)
+        rel = self.full_data.relative_time
+        self.plot_widget.add_region_selector(rel[0], rel[-1])
     
-    def _get_selected_records(self) -> List[MeasurementRecord]:
+    def _get_selected_indices(self) -> Tuple[int, int]:
+        """Get the [i0, i1) sample index range covered by the region selector."""
         time_range = self.plot_widget.get_selected_range()
         if not time_range:
-            return self.full_data
-        t0, t1 = time_range
-        # Filter by relative time (matches the plot axis)
-        return [r for r in self.full_data if t0 <= r.relative_time <= t1]
+            return 0, len(self.full_data)
+        # Binary search on relative time (matches the plot axis)
+        return self.full_data.search(*time_range)
+    
+    def _get_selected_records(self) -> MeasurementTable:
+        """Zero-copy table of the selected samples (list-compatible)."""
+        return self.full_data.view(*self._get_selected_indices())
     
     def _update_selection_stats(self) -> None:
-        records = self._get_selected_records()
+        i0, i1 = self._get_selected_indices()
+        count = i1 - i0
         
-        if len(records) < 2:
+        if count < 2:
             self.sel_samples_label.setText("Samples: --")
             self.sel_duration_label.setText("Duration: --")
             self.sel_power_label.setText("Avg Power: --")
             return
         
         # Use relative_time for accurate duration (unix_time can have sync issues)
-        duration = records[-1].relative_time - records[0].relative_time
-        avg_power = sum(r.power for r in records) / len(records)
+        rel = self.full_data.relative_time
+        duration = float(rel[i1 - 1] - rel[i0])
+        avg_power = self.full_data.power_sum(i0, i1) / count
         
-        self.sel_samples_label.setText(f"Samples: {len(records):,}")
+        self.sel_samples_label.setText(f"Samples: {count:,}")
         if duration < 60:
             self.sel_duration_label.setText(f"Duration: {duration:.1f}s")
         elif duration < 3600:
@@ -828,52 +1007,57 @@ class MainWindow(QtWidgets.QMainWindow):
         if not path:
             return
         
-        try:
-            records = CSVImporter.import_csv(Path(path))
-            
-            # Clear existing data and load imported
-            self._clear_data()
-            self.full_data = records
-            
-            # Populate plot buffers
-            for r in records:
-                self.buffers.append(r.unix_time, r.voltage, r.current, r.power)
-
-            # Update plot
-            self._do_plot_update()
-            self._enable_export()
-            
-            if records:
-                self.voltage_card.set_value(records[-1].voltage)
-                self.current_card.set_value(records[-1].current)
-                self.power_card.set_value(records[-1].power)
-            
-            self.samples_label.setText(f"Samples: {len(records):,}")
-            self.status_label.setText(f"● Imported: {Path(path).name}")
-            self.status_label.setStyleSheet(f"color: {self.theme.accent_primary};")
-            
-            # Calculate duration for message
-            if len(records) >= 2:
-                duration = records[-1].unix_time - records[0].unix_time
-                duration_str = f"{duration:.1f}s" if duration < 60 else f"{duration/60:.1f}m"
-            else:
-                duration_str = "N/A"
-            
-            QtWidgets.QMessageBox.information(
-                self, "Import Successful",
-                f"Imported {len(records):,} samples\n"
-                f"Duration: {duration_str}\n"
-                f"From: {Path(path).name}"
-            )
-            
-        except FileNotFoundError as e:
+        path = Path(path)
+        self._run_task(
+            lambda: CSVImporter.import_csv(path),
+            "Importing CSV...", "Importing",
+            lambda records: self._on_import_done(path, records),
+            self._on_import_error,
+        )
+    
+    def _on_import_done(self, path: Path, columns: MeasurementTable) -> None:
+        """Load imported columns into the session (GUI thread)."""
+        # Clear existing data and load imported
+        self._clear_data()
+        self.full_data.extend_table(columns)
+        count = len(self.full_data)
+        
+        # Update plot
+        self._do_plot_update()
+        self._enable_export()
+        
+        if count:
+            self.voltage_card.set_value(columns.voltage[-1])
+            self.current_card.set_value(columns.current[-1])
+            self.power_card.set_value(columns.power[-1])
+        
+        self.samples_label.setText(f"Samples: {count:,}")
+        self.status_label.setText(f"● Imported: {path.name}")
+        _set_tone(self.status_label, "primary")
+        
+        # Calculate duration for message
+        if count >= 2:
+            duration = float(columns.unix_time[-1] - columns.unix_time[0])
+            duration_str = f"{duration:.1f}s" if duration < 60 else f"{duration/60:.1f}m"
+        else:
+            duration_str = "N/A"
+        
+        QtWidgets.QMessageBox.information(
+            self, "Import Successful",
+            f"Imported {count:,} samples\n"
+            f"Duration: {duration_str}\n"
+            f"From: {path.name}"
+        )
+    
+    def _on_import_error(self, e: Exception) -> None:
+        if isinstance(e, FileNotFoundError):
             QtWidgets.QMessageBox.critical(self, "Error", str(e))
-        except ValueError as e:
+        elif isinstance(e, ValueError):
             QtWidgets.QMessageBox.critical(
                 self, "Import Error", 
                 f"Could not parse CSV file:\n{e}"
             )
-        except Exception as e:
+        else:
             QtWidgets.QMessageBox.critical(
                 self, "Error", 
                 f"Unexpected error during import:\n{e}"
@@ -901,12 +1085,13 @@ class MainWindow(QtWidgets.QMainWindow):
         )
     
     def _export_pdf(self) -> None:
-        records = self._get_selected_records()
+        i0, i1 = self._get_selected_indices()
+        records = self.full_data.view(i0, i1)
         if len(records) < 2:
             QtWidgets.QMessageBox.warning(self, "Error", "Need at least 2 samples.")
             return
         
-        stats = Statistics.from_records(records)
+        stats = Statistics.from_buffer(self.full_data, i0, i1)
         if not stats:
             QtWidgets.QMessageBox.warning(self, "Error", "Could not calculate statistics.")
             return
@@ -928,48 +1113,62 @@ class MainWindow(QtWidgets.QMainWindow):
             f"Saved to:\n{path}"
         )
         
+        # reportlab and matplotlib are pure Python; rendering in another
+        # process keeps them from competing with the GUI for the GIL. The
+        # pool thread only waits on the result.
+        pool = self._get_pdf_pool()
+        options = self.report_generator.options()
+        
         # Run export with progress dialog
         self._run_export(
-            lambda: self.report_generator.export_pdf(Path(path), stats, records),
+            lambda: pool.submit(render_pdf, options, Path(path), stats, records).result(),
             summary,
             "Generating PDF report..."
         )
     
+    def _get_pdf_pool(self) -> ProcessPoolExecutor:
+        """Return the PDF rendering process pool, creating it on first use."""
+        if self._pdf_pool is None:
+            # spawn: forking a process that runs Qt threads is unsafe
+            self._pdf_pool = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._pdf_pool
+    
     def _run_export(self, export_func, success_msg: str, progress_msg: str) -> None:
         """Run export function in background thread with progress dialog."""
-        from PySide6.QtCore import QThread, Signal
-        
-        class ExportWorker(QThread):
-            finished = Signal(bool, str)  # success, error_message
-            
-            def __init__(self, func):
-                super().__init__()
-                self.func = func
-            
-            def run(self):
-                try:
-                    self.func()
-                    self.finished.emit(True, "")
-                except Exception as e:
-                    self.finished.emit(False, str(e))
-        
+        self._run_task(
+            export_func, progress_msg, "Exporting",
+            lambda _: QtWidgets.QMessageBox.information(self, "Success", success_msg),
+            lambda e: QtWidgets.QMessageBox.critical(self, "Error", f"Export failed: {e}"),
+        )
+    
+    def _run_task(self, func: Callable[[], Any], progress_msg: str, title: str,
+                  on_done: Callable[[Any], None],
+                  on_error: Callable[[Exception], None]) -> None:
+        """Run func on the thread pool behind a modal busy dialog.
+        
+        on_done receives func's return value, on_error its exception;
+        both are called on the GUI thread after the dialog closes.
+        """
         progress = QtWidgets.QProgressDialog(progress_msg, None, 0, 0, self)
-        progress.setWindowTitle("Exporting")
+        progress.setWindowTitle(title)
         progress.setWindowModality(QtCore.Qt.WindowModal)
         progress.setMinimumDuration(0)
         progress.setCancelButton(None)
         progress.show()
         
-        def on_finished(success: bool, error: str):
+        worker = FunctionWorker(func)
+        # Keep the signals object alive until its result is delivered
+        self._active_workers.add(worker.signals)
+        
+        def finish(callback, value) -> None:
             progress.close()
-            worker.deleteLater()
-            if success:
-                QtWidgets.QMessageBox.information(self, "Success", success_msg)
-            else:
-                QtWidgets.QMessageBox.critical(self, "Error", f"Export failed: {error}")
-        
-        worker = ExportWorker(export_func)
-        worker.finished.connect(on_finished)
+            self._active_workers.discard(worker.signals)
+            callback(value)
+        
+        worker.signals.finished.connect(lambda result: finish(on_done, result))
+        worker.signals.error.connect(lambda e: finish(on_error, e))
         worker.start()
     
     # -------------------------------------------------------------------------
@@ -979,4 +1178,6 @@ class MainWindow(QtWidgets.QMainWindow):
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         if self.reader:
             self.reader.stop(self.STOP_TIMEOUT_MS)
+        if self._pdf_pool is not None:
+            self._pdf_pool.shutdown(wait=False)
         event.accept()
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(frozen=True)
 class ThemeColors:
-    """Color palette for a theme."""
+    """Color palette for a theme (immutable, so usable as a cache key)."""
+    # No per-instance __dict__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = (
+        'bg_primary', 'bg_secondary', 'bg_card', 'bg_elevated',
+        'accent_primary', 'accent_success', 'accent_warning', 'accent_danger',
+        'accent_purple',
+        'text_primary', 'text_secondary', 'text_muted',
+        'chart_voltage', 'chart_current', 'chart_power',
+        'border_default', 'border_hover',
+    )
+    
     # Backgrounds
     bg_primary: str
     bg_secondary: str
@@ -33,6 +44,10 @@ class ThemeColors:
     # Borders
     border_default: str
     border_hover: str
+    
+    def __reduce__(self):
+        # Default slot-state pickling would assign to the frozen fields
+        return (type(self), tuple(getattr(self, name) for name in self.__slots__))
 
 
 # Dark Theme (GitHub-inspired)
@@ -78,8 +93,9 @@ LIGHT_THEME = ThemeColors(
 )
 
 
+@lru_cache(maxsize=4)
 def generate_stylesheet(theme: ThemeColors) -> str:
-    """Generate Qt stylesheet from theme colors."""
+    """Generate Qt stylesheet from theme colors (cached per palette)."""
     return f"""
 QMainWindow {{
     background-color: {theme.bg_primary};
@@ -118,6 +134,21 @@ QLabel[class="stat-label"] {{
     text-transform: uppercase;
 }}
 
+QLabel[class="caption"] {{
+    font-size: 11px;
+}}
+
+QLabel[class="mono"] {{
+    font-family: monospace;
+}}
+
+QLabel[tone="muted"] {{ color: {theme.text_muted}; }}
+QLabel[tone="secondary"] {{ color: {theme.text_secondary}; }}
+QLabel[tone="primary"] {{ color: {theme.accent_primary}; }}
+QLabel[tone="success"] {{ color: {theme.accent_success}; }}
+QLabel[tone="warning"] {{ color: {theme.accent_warning}; }}
+QLabel[tone="power"] {{ color: {theme.chart_power}; }}
+
 QPushButton {{
     background-color: {theme.bg_card};
     color: {theme.text_primary};
@@ -287,4 +318,95 @@ QDialog {{
 QMessageBox {{
     background-color: {theme.bg_secondary};
 }}
+
+/* Settings dialog: only what differs from the rules above. Its labels are
+   styled by object name rather than with their own setStyleSheet(). */
+#settingsDialog QGroupBox {{
+    font-weight: 500;
+}}
+
+#settingsDialog QTabWidget::pane {{
+    border: 1px solid {theme.border_default};
+    border-radius: 6px;
+    background-color: {theme.bg_card};
+}}
+
+#settingsDialog QTabBar::tab {{
+    background-color: {theme.bg_secondary};
+    color: {theme.text_secondary};
+    border: 1px solid {theme.border_default};
+    border-bottom: none;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+    padding: 8px 16px;
+    margin-right: 2px;
+}}
+
+#settingsDialog QTabBar::tab:selected {{
+    background-color: {theme.bg_card};
+    color: {theme.text_primary};
+}}
+
+#settingsDialog QComboBox {{
+    border-radius: 4px;
+}}
+
+#settingsDialog QComboBox QAbstractItemView {{
+    color: {theme.text_primary};
+}}
+
+#settingsDialog QPushButton {{
+    padding: 8px 16px;
+}}
+
+#settingsDialog QFrame[class="card"] {{
+    background-color: {theme.bg_card};
+    border-radius: 6px;
+}}
+
+#settingsDialog QLabel#dialogTitle {{
+    font-size: 20px;
+    font-weight: 700;
+}}
+
+#settingsDialog QLabel#appName {{
+    font-size: 18px;
+    font-weight: 700;
+}}
+
+#settingsDialog QLabel#versionLabel {{
+    color: {theme.text_secondary};
+    font-size: 14px;
+}}
+
+#settingsDialog QLabel#description {{
+    color: {theme.text_secondary};
+}}
+
+#settingsDialog QLabel#hint {{
+    color: {theme.text_secondary};
+    font-size: 11px;
+}}
+
+#settingsDialog QLabel#previewLabel {{
+    color: #8b949e;
+}}
+
+#settingsDialog QLabel#mutedHint {{
+    color: #8b949e;
+    font-size: 11px;
+}}
+
+#settingsDialog QPushButton#urlLink {{
+    background-color: transparent;
+    border: none;
+    padding: 0;
+    color: {theme.accent_primary};
+    font-size: 13px;
+    font-weight: 400;
+}}
+
+#settingsDialog QPushButton#urlLink:hover {{
+    text-decoration: underline;
+}}
 """
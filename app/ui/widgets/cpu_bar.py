@@ -9,14 +9,24 @@ class CPUBar(QtWidgets.QWidget):
     """Displays CPU usage as a set of vertical bars.
 
     Designed for status bars: low height, compact width, no text overlay.
+    The background tracks and each filled bar height are rendered once
+    into pixmaps, so a repaint only blits them.
     """
 
+    BAR_WIDTH = 6
+    BAR_SPACING = 2
+
     def __init__(self, bar_count: int = 6, parent=None):
         super().__init__(parent)
         self._usage: float = 0.0
+        self._fill_px = 0  # Filled height in pixels last painted for _usage
         self._bar_count = max(3, bar_count)
         self._fill_color = QtGui.QColor("#4caf50")
         self._bg_color = QtGui.QColor(60, 60, 60, 120)
+        self._fill_brush = QtGui.QBrush(self._fill_color)
+        self._bg_brush = QtGui.QBrush(self._bg_color)
+        self._track_pixmap = None  # Rendered on the next paint
+        self._fill_sprites = {}  # Filled bar height -> QPixmap
         self.setFixedHeight(28)
         self.setFixedWidth(self._bar_count * 8 + (self._bar_count - 1) * 2)
         self.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
@@ -24,43 +34,91 @@ class CPUBar(QtWidgets.QWidget):
     def set_colors(self, fill: str, background: str) -> None:
         self._fill_color = QtGui.QColor(fill)
         self._bg_color = QtGui.QColor(background)
+        self._fill_brush = QtGui.QBrush(self._fill_color)
+        self._bg_brush = QtGui.QBrush(self._bg_color)
+        self._drop_sprites()
         self.update()
 
     def set_usage(self, usage: float) -> None:
         clamped = max(0.0, min(usage, 100.0))
-        if abs(clamped - self._usage) < 0.1:
-            return
         self._usage = clamped
+        # The bars are quantized to whole pixels: repaint only when the
+        # filled height actually moves
+        fill_px = int(self.height() * clamped / 100.0)
+        if fill_px == self._fill_px:
+            return
+        self._fill_px = fill_px
         self.update()
 
-    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self._drop_sprites()
+        super().resizeEvent(event)
 
-        w = self.width()
-        h = self.height()
-        bar_w = 6
-        spacing = 2
+    def _drop_sprites(self) -> None:
+        """Forget the pre-rendered pixmaps; they are rebuilt when painted."""
+        self._track_pixmap = None
+        self._fill_sprites = {}
 
-        usage_ratio = self._usage / 100.0 if self._usage > 0 else 0.0
+    def _blank_pixmap(self, width: int, height: int) -> QtGui.QPixmap:
+        """Transparent pixmap of the given logical size at the screen scale."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(round(width * dpr), round(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.transparent)
+        return pixmap
 
+    def _render_tracks(self) -> QtGui.QPixmap:
+        """Render the background tracks, which do not depend on usage."""
+        h = self.height()
+        pixmap = self._blank_pixmap(self.width(), h)
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(self._bg_brush)
         for idx in range(self._bar_count):
-            x = idx * (bar_w + spacing)
-            # Subdivide usage across bars uniformly
-            bar_height = int(h * usage_ratio)
-            # Slight taper for a more modern look
-            taper = max(0, self._bar_count - idx - 1)
-            bar_height = max(2, bar_height - taper)
-            y = h - bar_height
+            painter.drawRoundedRect(idx * (self.BAR_WIDTH + self.BAR_SPACING),
+                                    2, self.BAR_WIDTH, h - 4, 2, 2)
+        painter.end()
+        return pixmap
 
-            # Background track
-            painter.setBrush(self._bg_color)
+    def _fill_sprite(self, bar_height: int) -> QtGui.QPixmap:
+        """Antialiased filled bar of the given height, rendered once."""
+        sprite = self._fill_sprites.get(bar_height)
+        if sprite is None:
+            sprite = self._blank_pixmap(self.BAR_WIDTH, bar_height - 2)
+            painter = QtGui.QPainter(sprite)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
             painter.setPen(QtCore.Qt.NoPen)
-            painter.drawRoundedRect(x, 2, bar_w, h - 4, 2, 2)
+            painter.setBrush(self._fill_brush)
+            painter.drawRoundedRect(0, 0, self.BAR_WIDTH, bar_height - 2, 2, 2)
+            painter.end()
+            self._fill_sprites[bar_height] = sprite
+        return sprite
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        # Re-rendered after a resize, a color change or a move to a screen
+        # with another scale factor
+        pixmap = self._track_pixmap
+        if pixmap is None or pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            self._drop_sprites()
+            pixmap = self._track_pixmap = self._render_tracks()
+
+        # Only pixmap blits from here: the rounded shapes were rasterized
+        # (with antialiasing) when the sprites were built
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+
+        h = self.height()
+        fill_px = int(h * self._usage / 100.0)
+        for idx in range(self._bar_count):
+            # Subdivide usage across bars uniformly, with a slight taper
+            # for a more modern look
+            taper = max(0, self._bar_count - idx - 1)
+            bar_height = max(2, fill_px - taper)
 
             # Filled portion
             if bar_height > 2:
-                painter.setBrush(self._fill_color)
-                painter.drawRoundedRect(x, y, bar_w, bar_height - 2, 2, 2)
+                painter.drawPixmap(idx * (self.BAR_WIDTH + self.BAR_SPACING),
+                                   h - bar_height, self._fill_sprite(bar_height))
 
         painter.end()
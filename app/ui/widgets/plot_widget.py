@@ -1,7 +1,7 @@
 """Three-panel power monitoring plot widget with time window control."""
 
 from __future__ import annotations
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pyqtgraph as pg
@@ -22,6 +22,49 @@ from ..theme import ThemeColors
 from .plot_buffers import PlotBuffers
 
 
+def _m4_decimate(xs: np.ndarray, ys: Tuple[np.ndarray, ...], i0: int, i1: int,
+                 bins: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """M4 decimation of xs[i0:i1] into `bins` equal-time columns.
+    
+    Each non-empty column keeps its first, min, max and last sample, at
+    their own times and in time order, which is enough to draw the same
+    line as the full data when one column maps to one pixel. The min and
+    max samples differ per series, so each series gets its own x.
+    
+    Returns:
+        List of (x, y) for each input series
+    """
+    seg_x = xs[i0:i1]
+    n = len(seg_x)
+    edges = np.linspace(seg_x[0], seg_x[-1], bins + 1)[:-1]
+    starts = np.unique(np.searchsorted(seg_x, edges))  # drop empty bins
+    lasts = np.empty_like(starts)
+    lasts[:-1] = starts[1:] - 1
+    lasts[-1] = n - 1
+    column = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    positions = np.arange(n)
+    
+    def arg_extreme(seg: np.ndarray, ufunc) -> np.ndarray:
+        """Index of the first sample equal to each column's extreme."""
+        extreme = ufunc.reduceat(seg, starts)
+        hits = np.where(seg == extreme[column], positions, n)
+        # A column whose extreme is NaN has no hit: fall back to its last sample
+        return np.minimum(np.minimum.reduceat(hits, starts), lasts)
+    
+    out = []
+    for y in ys:
+        seg = y[i0:i1]
+        lo = arg_extreme(seg, np.minimum)
+        hi = arg_extreme(seg, np.maximum)
+        idx = np.empty(4 * len(starts), dtype=np.intp)
+        idx[0::4] = starts
+        idx[1::4] = np.minimum(lo, hi)
+        idx[2::4] = np.maximum(lo, hi)
+        idx[3::4] = lasts
+        out.append((seg_x[idx], seg[idx]))
+    return out
+
+
 class PlotWidget(pg.GraphicsLayoutWidget):
     """Three-panel plot widget with sliding time window.
     
@@ -46,6 +89,7 @@ class PlotWidget(pg.GraphicsLayoutWidget):
     MIN_WINDOW_SECONDS = 1.0
     MAX_WINDOW_SECONDS = 300.0  # 5 minutes max
     ZOOM_FACTOR = 1.2
+    M4_POINTS_PER_PIXEL = 4  # Decimate above this many samples per pixel
     
     def __init__(self, theme: ThemeColors, parent=None):
         super().__init__(parent)
@@ -67,6 +111,10 @@ class PlotWidget(pg.GraphicsLayoutWidget):
         self._crosshair_lines = []
         self._current_data = (np.array([]), np.array([]), np.array([]), np.array([]))
         
+        # Sample index span last passed to the curves; samples are only
+        # ever appended, so an unchanged span means unchanged geometry
+        self._drawn_span: Optional[Tuple[int, int, int]] = None
+        
         self._setup_plots()
         self._setup_crosshair()
         self.region: Optional[pg.LinearRegionItem] = None
@@ -76,8 +124,9 @@ class PlotWidget(pg.GraphicsLayoutWidget):
     
     def _setup_plots(self) -> None:
         """Create the three plot panels."""
-        # Enable antialiasing for smooth lines
-        pg.setConfigOptions(antialias=True)
+        # Antialiased wide lines are the slow path on the GL backend;
+        # keep antialiasing only for software rendering
+        pg.setConfigOptions(antialias=not _OPENGL_AVAILABLE)
         
         # Voltage plot
         self.plot_v = self.addPlot(
@@ -240,10 +289,26 @@ class PlotWidget(pg.GraphicsLayoutWidget):
         idx_start = max(0, np.searchsorted(xs, t_start) - 1)
         idx_end = min(len(xs), np.searchsorted(xs, t_end) + 1)
         
-        # Update curves with only visible data
-        self.curve_v.setData(xs[idx_start:idx_end], vs[idx_start:idx_end])
-        self.curve_i.setData(xs[idx_start:idx_end], cs[idx_start:idx_end])
-        self.curve_p.setData(xs[idx_start:idx_end], ps[idx_start:idx_end])
+        # One M4 bin per horizontal pixel once there are more than
+        # M4_POINTS_PER_PIXEL samples per pixel to draw
+        width = max(1, int(self.plot_v.getViewBox().width()))
+        decimate = idx_end - idx_start > self.M4_POINTS_PER_PIXEL * width
+        
+        # Update curves with only visible data, skipping the path rebuild
+        # when neither new samples nor the view moved it
+        span = (idx_start, idx_end, width if decimate else 0)
+        if span != self._drawn_span:
+            if decimate:
+                (xv, v), (xc, c), (xp, p) = _m4_decimate(
+                    xs, (vs, cs, ps), idx_start, idx_end, width
+                )
+            else:
+                xv = xc = xp = xs[idx_start:idx_end]
+                v, c, p = vs[idx_start:idx_end], cs[idx_start:idx_end], ps[idx_start:idx_end]
+            self.curve_v.setData(xv, v)
+            self.curve_i.setData(xc, c)
+            self.curve_p.setData(xp, p)
+            self._drawn_span = span
         
         self._updating = False
     
@@ -381,6 +446,7 @@ class PlotWidget(pg.GraphicsLayoutWidget):
         self.curve_v.setData([], [])
         self.curve_i.setData([], [])
         self.curve_p.setData([], [])
+        self._drawn_span = None
         self.remove_region_selector()
         
         # Reset state
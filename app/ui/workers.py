@@ -0,0 +1,43 @@
+"""Background workers for long-running UI tasks."""
+
+from __future__ import annotations
+from typing import Any, Callable
+
+from PySide6 import QtCore
+
+
+class WorkerSignals(QtCore.QObject):
+    """Signals of a FunctionWorker (QRunnable is not a QObject).
+
+    Signals:
+        finished: Emitted with the task's return value.
+        error: Emitted with the exception raised by the task.
+    """
+
+    finished = QtCore.Signal(object)
+    error = QtCore.Signal(object)
+
+
+class FunctionWorker(QtCore.QRunnable):
+    """Run a callable on the global QThreadPool.
+
+    Create the worker on the GUI thread so its signals are delivered
+    there, connect to `signals`, then call start().
+    """
+
+    def __init__(self, func: Callable[[], Any]):
+        super().__init__()
+        self.func = func
+        self.signals = WorkerSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.func()
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+    def start(self) -> None:
+        """Queue the task on the application-wide thread pool."""
+        QtCore.QThreadPool.globalInstance().start(self)
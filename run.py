@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """Launcher script for EdgePowerMeter application."""
 
-from app.main import main
-
 if __name__ == '__main__':
+    # Imported here, not at module level: spawned worker processes re-import
+    # this script and must not load the GUI
+    from app.main import main
     main()
@@ -0,0 +1,60 @@
+"""Tests for CSVImporter."""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from app.export.csv_importer import CSVImporter  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    """Always parse the CSV itself, never a cached copy."""
+    monkeypatch.setattr(CSVImporter, "_cache_path", classmethod(lambda cls, path: None))
+
+
+def write_csv(path: Path, header: str, rows) -> Path:
+    path.write_text("\n".join([header, *rows]) + "\n", encoding="utf-8")
+    return path
+
+
+def test_malformed_timestamps_are_skipped(tmp_path):
+    # Decimal commas: parsed by the csv reader, not the loadtxt fast path
+    path = write_csv(tmp_path / "data.csv", "Timestamp;Voltage[V];Current[A];Power[W]", [
+        "2024-03-10 12:00:00.000;5,0;0,1;0,5",
+        "2024-03-10;5,0;0,1;0,5",
+        "2024-03-10 12;5,0;0,1;0,5",
+        "2024-03-10 12:00:01.000;5,0;0,1;0,5",
+    ])
+    table = CSVImporter.import_csv(path)
+    assert len(table) == 2
+    assert table.relative_time.tolist() == [0.0, 1.0]
+
+
+@pytest.mark.parametrize("ts", [
+    "2024-03-10",
+    "2024-03-10 12",
+    "2024-03-10T12:00:05",
+    "2024-03-10 12:00:05+02:00",
+    "NaT",
+])
+def test_parse_timestamp_rejects_non_format_strings(monkeypatch, ts):
+    # As after a well-formed row: the remembered format is tried first
+    monkeypatch.setattr(CSVImporter, "_last_fmt", "%Y-%m-%d %H:%M:%S")
+    with pytest.raises(ValueError):
+        CSVImporter.parse_timestamp(ts)
+
+
+def test_malformed_row_after_clean_first_row_is_skipped(tmp_path):
+    # Clean first row: the file takes the loadtxt fast path
+    path = write_csv(tmp_path / "data.csv", "Timestamp,RelativeTime[s],Voltage[V],Current[A],Power[W]", [
+        "2024-03-10 12:00:00.000,0.000000,5.0,0.1,0.5",
+        "2024-03-10 12:00:00.500,0.500000,5.0,0.1,0.5",
+        "2024-03-10,0.750000,5.0,0.1,0.5",
+        "2024-03-10 12,0.800000,5.0,0.1,0.5",
+        "2024-03-10 12:00:01.000,1.000000,5.0,0.1,0.5",
+    ])
+    table = CSVImporter.import_csv(path)
+    assert table.relative_time.tolist() == [0.0, 0.5, 1.0]